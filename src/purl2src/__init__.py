@@ -1,12 +1,12 @@
 """Semantic Copycat Purl2Src - Translate PURLs to download URLs."""
 
 import warnings
+from typing import Any
 
 # Suppress urllib3 OpenSSL warning on macOS
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL 1.1.1+")
 
 from .parser import parse_purl
-from .handlers import get_download_url
 
 try:
     from importlib.metadata import version
@@ -16,4 +16,14 @@ except Exception:
     # Fallback for development installations
     __version__ = "0.0.0+unknown"
 
+
+def __getattr__(name: str) -> Any:
+    """Import the resolver on first access so importing the package stays cheap."""
+    if name == "get_download_url":
+        from .handlers import get_download_url
+
+        return get_download_url
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["parse_purl", "get_download_url"]
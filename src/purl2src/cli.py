@@ -1,15 +1,162 @@
 """Command-line interface for purl2src."""
 
+import csv
+import io
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 import click
 
 from . import __version__
 from .handlers import get_download_url
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # pragma: no cover - optional dependency
+
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON using the standard library, unescaped as orjson does."""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Default number of PURLs resolved concurrently in batch mode
+DEFAULT_JOBS = 8
+
+# Number of PURLs handed to a worker process at a time (--processes)
+PROCESS_CHUNK_SIZE = 64
+
+# Maximum number of progress bar redraws over a batch
+PROGRESS_UPDATES = 100
+
+
+def _resolve(purl_str: str, validate: bool) -> Dict[str, Any]:
+    """Resolve a single PURL, converting any exception into a failed result."""
+    try:
+        return get_download_url(purl_str, validate=validate).to_dict()
+    except Exception as e:
+        return {
+            "purl": purl_str,
+            "download_url": None,
+            "status": "failed",
+            "error": str(e),
+        }
+
+
+def _resolve_threaded(purls: List[str], validate: bool, jobs: int) -> Iterator[Dict[str, Any]]:
+    """
+    Resolve PURLs, yielding results in input order.
+
+    Resolution is dominated by network latency (registry queries and URL
+    validation), so batches are spread over a thread pool.
+    """
+    if len(purls) == 1 or jobs == 1:
+        for purl_str in purls:
+            yield _resolve(purl_str, validate)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(purls))) as executor:
+        yield from executor.map(partial(_resolve, validate=validate), purls)
+
+
+def _resolve_chunk(purls: List[str], validate: bool, jobs: int) -> List[Dict[str, Any]]:
+    """Resolve a chunk of PURLs inside a worker process."""
+    return list(_resolve_threaded(purls, validate, jobs))
+
+
+def _resolve_all(
+    purls: List[str], validate: bool, jobs: int, processes: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    Resolve PURLs, yielding results in input order.
+
+    Resolution is I/O bound, so threads are used by default. With more than one
+    process, batches are additionally sharded across worker processes, each
+    resolving its chunks with up to ``jobs`` threads.
+    """
+    if processes == 1 or len(purls) <= PROCESS_CHUNK_SIZE:
+        yield from _resolve_threaded(purls, validate, jobs)
+        return
+
+    chunks = [purls[i : i + PROCESS_CHUNK_SIZE] for i in range(0, len(purls), PROCESS_CHUNK_SIZE)]
+    resolve_chunk = partial(_resolve_chunk, validate=validate, jobs=jobs)
+    with ProcessPoolExecutor(max_workers=min(processes, len(chunks))) as executor:
+        for results in executor.map(resolve_chunk, chunks):
+            yield from results
+
+
+def _with_progress(results: Iterable[Dict[str, Any]], bar: Any) -> Iterator[Dict[str, Any]]:
+    """Pass results through, advancing the progress bar as each one arrives."""
+    for r in results:
+        bar.update(1)
+        yield r
+
+
+def _track_failures(
+    results: Iterable[Dict[str, Any]], failures: List[str]
+) -> Iterator[Dict[str, Any]]:
+    """Pass results through, recording the PURLs that failed to resolve."""
+    for r in results:
+        if r.get("status") == "failed":
+            failures.append(r["purl"])
+        yield r
+
+
+def _format_json(results: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Format results as a JSON array, one element at a time."""
+    empty = True
+    for r in results:
+        yield ("[\n  " if empty else ",\n  ") + _dumps(r).replace("\n", "\n  ")
+        empty = False
+    yield "[]" if empty else "\n]"
+
+
+def _format_csv(results: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Format results as CSV rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def render(row: List[str]) -> str:
+        writer.writerow(row)
+        line = buffer.getvalue()[:-1]  # drop the line terminator
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    yield render(["purl", "download_url", "status", "method"])
+    for r in results:
+        yield "\n" + render(
+            [r["purl"], r.get("download_url") or "", r.get("status", "failed"), r.get("method", "")]
+        )
+
+
+def _format_plain(results: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Format results as "purl -> url" lines."""
+    separator = ""
+    for r in results:
+        if r.get("download_url"):
+            yield f"{separator}{r['purl']} -> {r['download_url']}"
+        else:
+            error_msg = r.get("error", "Failed to resolve")
+            yield f"{separator}{r['purl']} -> ERROR: {error_msg}"
+        separator = "\n"
+
+
+_FORMATTERS: Dict[str, Callable[[Iterable[Dict[str, Any]]], Iterator[str]]] = {
+    "json": _format_json,
+    "csv": _format_csv,
+    "plain": _format_plain,
+}
+
 
 @click.command()
 @click.version_option(version=__version__, prog_name="purl2src")
@@ -29,6 +176,21 @@ from .handlers import get_download_url
 @click.option(
     "--format", type=click.Choice(["json", "csv", "plain"]), default="plain", help="Output format"
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_JOBS,
+    show_default=True,
+    help="Number of PURLs to resolve concurrently",
+)
+@click.option(
+    "--processes",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes for large batches, each running --jobs threads",
+)
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
 def main(
     purl: Optional[str],
@@ -36,6 +198,8 @@ def main(
     output: Optional[Path],
     validate: bool,
     format: str,
+    jobs: int,
+    processes: int,
     verbose: bool,
 ) -> None:
     """
@@ -56,91 +220,51 @@ def main(
         purls.append(purl)
 
     if file:
-        with open(file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    purls.append(line)
+        lines = file.read_text().splitlines()
+        purls.extend(s for line in lines if (s := line.strip()) and not s.startswith("#"))
 
     if not purls:
         click.echo("Error: No PURLs provided. Use --help for usage.", err=True)
         sys.exit(1)
 
-    # Process PURLs
-    results = []
-    errors = 0
-
-    # Only show progress bar for multiple PURLs in verbose mode
-    if len(purls) > 1 and verbose:
-        with click.progressbar(purls, label="Processing PURLs", show_pos=True) as purl_iter:
-            for purl_str in purl_iter:
-                try:
-                    result = get_download_url(purl_str, validate=validate)
-                    results.append(result.to_dict())
-
-                    if result.status == "failed":
-                        errors += 1
-
-                except Exception as e:
-                    result_dict = {
-                        "purl": purl_str,
-                        "download_url": None,
-                        "status": "failed",
-                        "error": str(e),
-                    }
-                    results.append(result_dict)
-                    errors += 1
-    else:
-        for purl_str in purls:
-            try:
-                result = get_download_url(purl_str, validate=validate)
-                results.append(result.to_dict())
-
-                if result.status == "failed":
-                    errors += 1
-
-            except Exception as e:
-                result_dict = {
-                    "purl": purl_str,
-                    "download_url": None,
-                    "status": "failed",
-                    "error": str(e),
-                }
-                results.append(result_dict)
-                errors += 1
-
-    # Format and output results
-    if format == "json":
-        output_data = json.dumps(results, indent=2)
-    elif format == "csv":
-        # Simple CSV output
-        lines = ["purl,download_url,status,method"]
-        for r in results:
-            lines.append(
-                f"{r['purl']},{r.get('download_url', '')},"
-                f"{r.get('status', 'failed')},{r.get('method', '')}"
+    # Process PURLs, writing each result as soon as it is available
+    failures: List[str] = []
+    formatter = _FORMATTERS[format]
+
+    with ExitStack() as stack:
+        results = _resolve_all(purls, validate, jobs, processes)
+
+        # Only show progress bar for multiple PURLs in verbose mode
+        if len(purls) > 1 and verbose:
+            bar = stack.enter_context(
+                click.progressbar(
+                    length=len(purls),
+                    label="Processing PURLs",
+                    show_pos=True,
+                    file=sys.stderr,
+                    update_min_steps=max(1, len(purls) // PROGRESS_UPDATES),
+                )
             )
-        output_data = "\n".join(lines)
-    else:  # plain
-        lines = []
-        for r in results:
-            if r.get("download_url"):
-                lines.append(f"{r['purl']} -> {r['download_url']}")
-            else:
-                error_msg = r.get("error", "Failed to resolve")
-                lines.append(f"{r['purl']} -> ERROR: {error_msg}")
-        output_data = "\n".join(lines)
-
-    # Write output
+            results = _with_progress(results, bar)
+
+        if output:
+            write: Callable[[str], Any] = stack.enter_context(
+                open(output, "w", encoding="utf-8")
+            ).write
+        else:
+            write = partial(click.echo, nl=False)
+
+        for chunk in formatter(_track_failures(results, failures)):
+            write(chunk)
+
     if output:
-        with open(output, "w") as f:
-            f.write(output_data)
         if verbose:
             click.echo(f"Results written to {output}")
     else:
-        click.echo(output_data)
+        click.echo()
 
     # Exit with error code if any failures
+    errors = len(failures)
     if errors > 0:
         if verbose:
             click.echo(f"\nCompleted with {errors} error(s)", err=True)
@@ -1,34 +1,138 @@
 """Package ecosystem handlers."""
 
-from typing import Dict, Optional, Type
+import atexit
+import threading
+from dataclasses import replace
+from importlib import import_module
+from typing import Any, Dict, Iterator, MutableMapping, Optional, Tuple, Type
+
+from ..parser import Purl, parse_purl
+from ..utils import HttpClient, URLCache
 from .base import BaseHandler, HandlerResult
-from .npm import NpmHandler
-from .pypi import PyPiHandler
-from .cargo import CargoHandler
-from .nuget import NuGetHandler
-from .github import GitHubHandler
-from .generic import GenericHandler
-from .conda import CondaHandler
-from .golang import GoLangHandler
-from .rubygems import RubyGemsHandler
-from .maven import MavenHandler
-
-# Registry of all available handlers
-HANDLERS: Dict[str, Type[BaseHandler]] = {
-    "npm": NpmHandler,
-    "pypi": PyPiHandler,
-    "cargo": CargoHandler,
-    "nuget": NuGetHandler,
-    "github": GitHubHandler,
-    "generic": GenericHandler,
-    "conda": CondaHandler,
-    "golang": GoLangHandler,
-    "gem": RubyGemsHandler,
-    "rubygems": RubyGemsHandler,
-    "maven": MavenHandler,
+
+# Ecosystem -> (module, class) for each handler; modules are imported on first use
+_HANDLER_MODULES: Dict[str, Tuple[str, str]] = {
+    "npm": (".npm", "NpmHandler"),
+    "pypi": (".pypi", "PyPiHandler"),
+    "cargo": (".cargo", "CargoHandler"),
+    "nuget": (".nuget", "NuGetHandler"),
+    "github": (".github", "GitHubHandler"),
+    "generic": (".generic", "GenericHandler"),
+    "conda": (".conda", "CondaHandler"),
+    "golang": (".golang", "GoLangHandler"),
+    "gem": (".rubygems", "RubyGemsHandler"),
+    "rubygems": (".rubygems", "RubyGemsHandler"),
+    "maven": (".maven", "MavenHandler"),
 }
 
 
+class _HandlerRegistry(MutableMapping[str, Type[BaseHandler]]):
+    """Ecosystem -> handler class mapping that imports handler modules on first lookup."""
+
+    def __init__(
+        self,
+        modules: Dict[str, Tuple[str, str]],
+        loaded: Optional[Dict[str, Type[BaseHandler]]] = None,
+    ):
+        self._modules = dict(modules)
+        self._loaded: Dict[str, Type[BaseHandler]] = dict(loaded or {})
+
+    def __getitem__(self, ecosystem: str) -> Type[BaseHandler]:
+        handler_class = self._loaded.get(ecosystem)
+        if handler_class is None:
+            module_name, class_name = self._modules[ecosystem]
+            handler_class = getattr(import_module(module_name, __name__), class_name)
+            self._loaded[ecosystem] = handler_class
+        return handler_class
+
+    def __setitem__(self, ecosystem: str, handler_class: Type[BaseHandler]) -> None:
+        self._loaded[ecosystem] = handler_class
+
+    def __delitem__(self, ecosystem: str) -> None:
+        if ecosystem not in self:
+            raise KeyError(ecosystem)
+        self._modules.pop(ecosystem, None)
+        self._loaded.pop(ecosystem, None)
+
+    def __contains__(self, ecosystem: object) -> bool:
+        return ecosystem in self._loaded or ecosystem in self._modules
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._modules
+        yield from (ecosystem for ecosystem in self._loaded if ecosystem not in self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules.keys() | self._loaded.keys())
+
+    def clear(self) -> None:
+        self._modules.clear()
+        self._loaded.clear()
+
+    def copy(self) -> "_HandlerRegistry":
+        return _HandlerRegistry(self._modules, self._loaded)
+
+
+# Registry of all available handlers, keyed by ecosystem
+HANDLERS: MutableMapping[str, Type[BaseHandler]] = _HandlerRegistry(_HANDLER_MODULES)
+
+# Handler class name -> module, for `from purl2src.handlers import NpmHandler`
+_HANDLER_CLASS_MODULES: Dict[str, str] = {
+    class_name: module_name for module_name, class_name in _HANDLER_MODULES.values()
+}
+
+# HTTP client shared by all handlers so connections are reused between PURLs
+_http_client: Optional[HttpClient] = None
+
+# URL caches shared by all lookups, keyed by TTL, so the in-memory LRU persists
+_url_caches: Dict[int, URLCache] = {}
+
+# Guards lazy creation of the shared HTTP client and URL caches
+_shared_lock = threading.Lock()
+
+# Cache lifetime for PURLs without a version, whose latest release can change
+DEFAULT_CACHE_TTL = 3600
+
+# Cache lifetime for PURLs pinned to a version; published artifacts are immutable
+PINNED_CACHE_TTL = 7 * 24 * 3600
+
+
+def _cache_key(purl: Purl) -> str:
+    """Build a canonical cache key so equivalent PURLs share a cache entry."""
+    return str(replace(purl, qualifiers=dict(sorted(purl.qualifiers.items()))))
+
+
+def _get_http_client() -> HttpClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    with _shared_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+def _get_url_cache(ttl: int) -> URLCache:
+    """Return the shared URL cache for a TTL, creating it on first use."""
+    with _shared_lock:
+        cache = _url_caches.get(ttl)
+        if cache is None:
+            cache = _url_caches[ttl] = URLCache(ttl=ttl)
+        return cache
+
+
+def _get_handler_class(ecosystem: str) -> Optional[Type[BaseHandler]]:
+    """Return the handler class for an ecosystem, importing its module on first use."""
+    return HANDLERS.get(ecosystem)
+
+
+def __getattr__(name: str) -> Any:
+    """Import handler classes on first access so importing the package stays cheap."""
+    module_name = _HANDLER_CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
+
+
 def get_download_url(purl: str, validate: bool = True) -> HandlerResult:
     """
     Get download URL for a Package URL.
@@ -40,20 +144,18 @@ def get_download_url(purl: str, validate: bool = True) -> HandlerResult:
     Returns:
         HandlerResult with download URL and metadata
     """
-    from ..parser import parse_purl
-    from ..utils import HttpClient, URLCache
+    # Parse PURL
+    parsed = parse_purl(purl)
 
     # Check cache first
-    cache = URLCache()
-    cached = cache.get(purl)
+    cache = _get_url_cache(PINNED_CACHE_TTL if parsed.version else DEFAULT_CACHE_TTL)
+    cache_key = _cache_key(parsed)
+    cached = cache.get(cache_key)
     if cached:
         return HandlerResult(**cached)
 
-    # Parse PURL
-    parsed = parse_purl(purl)
-
     # Get appropriate handler
-    handler_class = HANDLERS.get(parsed.ecosystem)
+    handler_class = _get_handler_class(parsed.ecosystem)
     if not handler_class:
         return HandlerResult(
             purl=purl,
@@ -66,13 +168,12 @@ def get_download_url(purl: str, validate: bool = True) -> HandlerResult:
         )
 
     # Create handler and get download URL
-    with HttpClient() as http_client:
-        handler = handler_class(http_client)
-        result = handler.get_download_url(parsed, validate=validate)
+    handler = handler_class(_get_http_client())
+    result = handler.get_download_url(parsed, validate=validate)
 
     # Cache successful results
     if result.download_url and result.validated:
-        cache.set(purl, result.to_dict())
+        cache.set(cache_key, result.to_dict())
 
     return result
 
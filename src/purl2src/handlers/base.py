@@ -2,16 +2,23 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import shutil
 import subprocess
 import shlex
 
-from ..parser import Purl
+from ..parser import _SLOTS, Purl
 from ..utils.http import HttpClient
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _which_cached(cmd: str) -> Optional[str]:
+    """Look up a command on PATH once per process."""
+    return shutil.which(cmd)
+
+
+@dataclass(**_SLOTS)
 class HandlerResult:
     """Result from handler processing."""
 
@@ -171,7 +178,7 @@ class BaseHandler(ABC):
     def is_package_manager_available(self) -> bool:
         """Check if package manager is installed."""
         for cmd in self.get_package_manager_cmd():
-            if shutil.which(cmd):
+            if _which_cached(cmd):
                 return True
         return False
 
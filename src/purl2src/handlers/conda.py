@@ -1,10 +1,25 @@
 """Conda handler."""
 
+import re
 from typing import Optional, List
 
 from ..parser import Purl
 from .base import BaseHandler, HandlerError
 
+# "url : https://..." line of `conda search --info` output; never spans lines
+_URL_LINE = re.compile(r"url[^\S\n]*:[^\S\n]*(https?://\S+)", re.IGNORECASE)
+
+# Main/defaults channel uses repo.anaconda.com
+_MAIN_URL = "https://repo.anaconda.com/pkgs/main/{subdir}/{name}-{version}-{build}.tar.bz2"
+# Community channels (conda-forge, bioconda, etc.) use anaconda.org
+_COMMUNITY_URL = (
+    "https://anaconda.org/{channel}/{name}/{version}/"
+    "download/{subdir}/{name}-{version}-{build}.tar.bz2"
+)
+_CHANNEL_URLS = {"main": _MAIN_URL, "defaults": _MAIN_URL}
+# Reported alphabetically when several are missing, i.e. build, channel, subdir
+_REQUIRED_QUALIFIERS = frozenset({"build", "channel", "subdir"})
+
 
 class CondaHandler(BaseHandler):
     """Handler for Conda packages."""
@@ -21,29 +36,18 @@ class CondaHandler(BaseHandler):
         if not purl.version:
             return None
 
-        # Check required qualifiers
-        required = ["build", "channel", "subdir"]
-        for qual in required:
-            if qual not in purl.qualifiers:
-                raise HandlerError(f"Missing required qualifier: {qual}")
+        missing = _REQUIRED_QUALIFIERS.difference(purl.qualifiers)
+        if missing:
+            raise HandlerError(f"Missing required qualifier: {min(missing)}")
 
         build = purl.qualifiers["build"]
         channel = purl.qualifiers["channel"]
         subdir = purl.qualifiers["subdir"]
 
-        # Handle different channel types
-        if channel in ["main", "defaults"]:
-            # Main/defaults channel uses repo.anaconda.com
-            return (
-                f"https://repo.anaconda.com/pkgs/main/{subdir}/"
-                f"{purl.name}-{purl.version}-{build}.tar.bz2"
-            )
-        else:
-            # Community channels (conda-forge, bioconda, etc.) use anaconda.org
-            return (
-                f"https://anaconda.org/{channel}/{purl.name}/{purl.version}/"
-                f"download/{subdir}/{purl.name}-{purl.version}-{build}.tar.bz2"
-            )
+        template = _CHANNEL_URLS.get(channel, _COMMUNITY_URL)
+        return template.format(
+            channel=channel, subdir=subdir, name=purl.name, version=purl.version, build=build
+        )
 
     def get_download_url_from_api(self, purl: Purl) -> Optional[str]:
         """Query Anaconda API."""
@@ -64,12 +68,5 @@ class CondaHandler(BaseHandler):
 
     def parse_fallback_output(self, output: str) -> Optional[str]:
         """Parse conda search output."""
-        # Look for "url" line with various formatting
-        import re
-
-        for line in output.split("\n"):
-            # Look for pattern: url (spaces) : (spaces) http...
-            match = re.search(r"url\s*:\s*(https?://\S+)", line, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
+        match = _URL_LINE.search(output)
+        return match.group(1) if match else None
@@ -1,11 +1,31 @@
 """Generic handler using qualifiers."""
 
 import re
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from ..parser import Purl
 from .base import BaseHandler, HandlerResult
 
+# Repository URL with an optional trailing @<commit hash>
+_VCS_COMMIT = re.compile(r"(.+)@([a-f0-9]+)$")
+
+# Qualifier keys read by this handler
+_DOWNLOAD_URL = "download_url"
+_VCS_URL = "vcs_url"
+_CHECKSUM = "checksum"
+
+
+def _parse_vcs_url(vcs_url: str) -> Tuple[str, Optional[str]]:
+    """Split a vcs_url qualifier into repository URL and commit hash (if any)."""
+    # Handle git+https:// prefix
+    if vcs_url.startswith("git+"):
+        vcs_url = vcs_url[4:]
+
+    match = _VCS_COMMIT.match(vcs_url)
+    if match:
+        return match.group(1), match.group(2)
+    return vcs_url, None
+
 
 class GenericHandler(BaseHandler):
     """Handler for generic packages using qualifiers."""
@@ -13,26 +33,18 @@ class GenericHandler(BaseHandler):
     def build_download_url(self, purl: Purl) -> Optional[str]:
         """Build URL from qualifiers."""
         # Check for direct download_url qualifier
-        if "download_url" in purl.qualifiers:
-            return purl.qualifiers["download_url"]
+        download_url = purl.qualifiers.get(_DOWNLOAD_URL)
+        if download_url is not None:
+            return download_url
 
         # Check for vcs_url qualifier
-        if "vcs_url" in purl.qualifiers:
-            vcs_url = purl.qualifiers["vcs_url"]
-
-            # Handle git+https:// prefix
-            if vcs_url.startswith("git+"):
-                vcs_url = vcs_url[4:]
-
-            # Extract commit hash if present
-            match = re.match(r"(.+)@([a-f0-9]+)$", vcs_url)
-            if match:
-                repo_url, commit = match.groups()
+        vcs_url = purl.qualifiers.get(_VCS_URL)
+        if vcs_url is not None:
+            repo_url, commit = _parse_vcs_url(vcs_url)
+            if commit:
                 # Store commit for later checkout
                 self._commit = commit
-                return repo_url
-
-            return vcs_url
+            return repo_url
 
         return None
 
@@ -42,20 +54,12 @@ class GenericHandler(BaseHandler):
 
     def get_fallback_cmd(self, purl: Purl) -> Optional[str]:
         """Get git command for VCS URLs."""
-        if "vcs_url" in purl.qualifiers:
-            vcs_url = purl.qualifiers["vcs_url"]
-
-            # Handle git+https:// prefix
-            if vcs_url.startswith("git+"):
-                vcs_url = vcs_url[4:]
-
-            # Extract commit hash if present
-            match = re.match(r"(.+)@([a-f0-9]+)$", vcs_url)
-            if match:
-                repo_url, commit = match.groups()
+        vcs_url = purl.qualifiers.get(_VCS_URL)
+        if vcs_url is not None:
+            repo_url, commit = _parse_vcs_url(vcs_url)
+            if commit:
                 return f"git clone {repo_url} && git checkout {commit}"
-
-            return f"git clone {vcs_url}"
+            return f"git clone {repo_url}"
 
         return None
 
@@ -73,10 +77,10 @@ class GenericHandler(BaseHandler):
         result = super().get_download_url(purl, validate)
 
         # If we have a download URL and checksum, validate it
-        if result.download_url and result.validated and "checksum" in purl.qualifiers:
+        checksum = purl.qualifiers.get(_CHECKSUM)
+        if result.download_url and result.validated and checksum is not None:
             try:
                 # Download and verify checksum
-                checksum = purl.qualifiers["checksum"]
                 # Extract algorithm if specified (e.g., sha256:abc123)
                 if ":" in checksum:
                     algo, value = checksum.split(":", 1)
@@ -34,13 +34,11 @@ class MavenHandler(BaseHandler):
         # Get file type
         file_type = purl.qualifiers.get("type", "jar")
 
-        # Build filename
-        filename = f"{purl.name}-{purl.version}"
-        if classifier:
-            filename += f"-{classifier}"
-        filename += f".{file_type}"
-
-        return f"{repo_url}/{group_path}/{purl.name}/{purl.version}/{filename}"
+        suffix = f"-{classifier}" if classifier else ""
+        return (
+            f"{repo_url}/{group_path}/{purl.name}/{purl.version}/"
+            f"{purl.name}-{purl.version}{suffix}.{file_type}"
+        )
 
     def get_download_url_from_api(self, purl: Purl) -> Optional[str]:
         """Maven Central doesn't have a simple JSON API."""
@@ -51,25 +49,21 @@ class MavenHandler(BaseHandler):
         if not purl.version or not purl.namespace:
             return None
 
-        # Build artifact coordinates
-        coords = f"{purl.namespace}:{purl.name}:{purl.version}"
-
-        # Add type if specified
-        file_type = purl.qualifiers.get("type", "jar")
-        coords += f":{file_type}"
+        # Build artifact coordinates: group:artifact:version:type[:classifier]
+        parts = [purl.namespace, purl.name, purl.version, purl.qualifiers.get("type", "jar")]
 
         # Add classifier if specified
         classifier = purl.qualifiers.get("classifier")
         if not classifier and purl.qualifiers.get("packaging") == "sources":
             classifier = "sources"
         if classifier:
-            coords += f":{classifier}"
+            parts.append(classifier)
 
-        cmd = f"mvn dependency:get -Dartifact={coords} -Dtransitive=false"
+        cmd = f"mvn dependency:get -Dartifact={':'.join(parts)} -Dtransitive=false"
 
         # Add custom repository if specified
         if "repository_url" in purl.qualifiers:
-            cmd += f" -DremoteRepositories={purl.qualifiers['repository_url']}"
+            return f"{cmd} -DremoteRepositories={purl.qualifiers['repository_url']}"
 
         return cmd
 
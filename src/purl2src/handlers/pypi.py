@@ -7,6 +7,17 @@ from urllib.parse import quote
 from ..parser import Purl
 from .base import BaseHandler
 
+# Content type requesting the JSON form of the simple index (PEP 691)
+SIMPLE_INDEX_ACCEPT = "application/vnd.pypi.simple.v1+json"
+
+# Runs of separators collapsed by PEP 503 name normalization
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a project name as described in PEP 503."""
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
 
 class PyPiHandler(BaseHandler):
     """Handler for PyPI packages."""
@@ -30,8 +41,16 @@ class PyPiHandler(BaseHandler):
         )
 
     def get_download_url_from_api(self, purl: Purl) -> Optional[str]:
-        """Query PyPI JSON API for download URL."""
-        # API URL
+        """Query PyPI for download URL, preferring the lightweight simple index."""
+        if purl.version:
+            try:
+                url = self.get_download_url_from_simple_index(purl)
+                if url:
+                    return url
+            except Exception:
+                pass
+
+        # The JSON API returns the full release history, so only use it when needed
         api_url = f"https://pypi.org/pypi/{purl.name}/json"
 
         try:
@@ -66,6 +85,35 @@ class PyPiHandler(BaseHandler):
         except Exception:
             return None
 
+    def get_download_url_from_simple_index(self, purl: Purl) -> Optional[str]:
+        """
+        Query the PEP 691 JSON simple index for a source distribution URL.
+
+        The simple index only lists file names and URLs, so it is much smaller
+        than the JSON API response for packages with a long release history.
+
+        Args:
+            purl: Parsed PURL object
+
+        Returns:
+            Source distribution URL or None if the version has no sdist
+        """
+        project = _normalize_name(purl.name)
+        data = self.http_client.get_json(
+            f"https://pypi.org/simple/{project}/", headers={"Accept": SIMPLE_INDEX_ACCEPT}
+        )
+
+        for file_info in data.get("files", []):
+            filename = file_info.get("filename", "")
+            if not filename.endswith(".tar.gz"):
+                continue
+            name, _, version = filename[: -len(".tar.gz")].rpartition("-")
+            if version == purl.version and _normalize_name(name) == project:
+                result: Optional[str] = file_info.get("url")
+                return result
+
+        return None
+
     def get_fallback_cmd(self, purl: Purl) -> Optional[str]:
         """Get pip command to download package."""
         if not purl.version:
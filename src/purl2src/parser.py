@@ -1,9 +1,19 @@
 """PURL (Package URL) parser implementation."""
 
 import re
-from typing import Dict, Optional, Tuple
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import unquote, parse_qs
 
+# Basic PURL regex pattern, compiled once at import
+# Handle @ in scoped packages by using non-greedy match
+_PURL_PATTERN = re.compile(r"^pkg:([^/]+)/(.+?)(@[^#?]+)?(\?[^#]+)?(#.+)?$")
+
+# Slotted dataclasses (no per-instance __dict__) require Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class PurlParseError(Exception):
     """Exception raised for PURL parsing errors."""
@@ -11,48 +21,51 @@ class PurlParseError(Exception):
     pass
 
 
+@dataclass(frozen=True, **_SLOTS)
 class Purl:
-    """Represents a parsed Package URL."""
-
-    def __init__(
-        self,
-        ecosystem: str,
-        name: str,
-        version: Optional[str] = None,
-        namespace: Optional[str] = None,
-        qualifiers: Optional[Dict[str, str]] = None,
-        subpath: Optional[str] = None,
-    ):
-        self.ecosystem = ecosystem.lower()
-        self.name = name
-        self.version = version
-        self.namespace = namespace
-        self.qualifiers = qualifiers or {}
-        self.subpath = subpath
+    """
+    Represents a parsed Package URL.
+
+    Instances are frozen because ``parse_purl`` memoizes its results and hands the same
+    object to every caller. ``qualifiers`` is a plain dict; treat it as read-only and
+    use ``dataclasses.replace`` or ``dict(purl.qualifiers)`` to derive a modified copy.
+    """
+
+    ecosystem: str
+    name: str
+    version: Optional[str] = None
+    namespace: Optional[str] = None
+    qualifiers: Dict[str, str] = field(default_factory=dict, hash=False)
+    subpath: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ecosystem", self.ecosystem.lower())
+        # Copy so the caller's dict is not aliased by a possibly shared instance
+        object.__setattr__(self, "qualifiers", dict(self.qualifiers or {}))
 
     def __str__(self) -> str:
         """Convert back to PURL string."""
-        purl = f"pkg:{self.ecosystem}/"
-        if self.namespace:
-            purl += f"{self.namespace}/"
-        purl += self.name
-        if self.version:
-            purl += f"@{self.version}"
-        if self.qualifiers:
-            quals = "&".join(f"{k}={v}" for k, v in self.qualifiers.items())
-            purl += f"?{quals}"
-        if self.subpath:
-            purl += f"#{self.subpath}"
-        return purl
+        namespace = f"{self.namespace}/" if self.namespace else ""
+        version = f"@{self.version}" if self.version else ""
+        qualifiers = (
+            "?" + "&".join(f"{k}={v}" for k, v in self.qualifiers.items())
+            if self.qualifiers
+            else ""
+        )
+        subpath = f"#{self.subpath}" if self.subpath else ""
+        return f"pkg:{self.ecosystem}/{namespace}{self.name}{version}{qualifiers}{subpath}"
 
     def __repr__(self) -> str:
         return f"Purl(ecosystem={self.ecosystem!r}, name={self.name!r}, version={self.version!r})"
 
 
+@lru_cache(maxsize=4096)
 def parse_purl(purl_string: str) -> Purl:
     """
     Parse a Package URL string into its components.
 
+    Results are memoized, so repeated PURLs in a batch are only parsed once.
+
     Format: pkg:{ecosystem}/[{namespace}/]{name}@{version}[?{qualifiers}][#{subpath}]
 
     Args:
@@ -67,10 +80,7 @@ def parse_purl(purl_string: str) -> Purl:
     if not purl_string:
         raise PurlParseError("Empty PURL string")
 
-    # Basic PURL regex pattern
-    # Handle @ in scoped packages by using non-greedy match
-    pattern = r"^pkg:([^/]+)/(.+?)(@[^#?]+)?(\?[^#]+)?(#.+)?$"
-    match = re.match(pattern, purl_string)
+    match = _PURL_PATTERN.match(purl_string)
 
     if not match:
         raise PurlParseError(f"Invalid PURL format: {purl_string}")
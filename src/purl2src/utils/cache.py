@@ -1,40 +1,135 @@
 """Simple URL cache implementation."""
 
+import hashlib
 import json
+import os
+import re
+import stat
+import threading
 import time
+from collections import OrderedDict
+from contextlib import suppress
 from pathlib import Path
 from typing import Optional, Dict, Any
 from functools import lru_cache
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a cache entry using orjson."""
+        return orjson.dumps(obj)
+
+    def _loads(raw: bytes) -> Any:
+        """Deserialize a cache entry using orjson."""
+        return orjson.loads(raw)
+
+except ImportError:  # pragma: no cover - optional dependency
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a cache entry compactly, as orjson does, using the standard library."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _loads(raw: bytes) -> Any:
+        """Deserialize a cache entry using the standard library."""
+        return json.loads(raw)
+
+
+# Entry timestamps are integer nanoseconds from time.time_ns()
+_NS_PER_SECOND = 1_000_000_000
+
+# Temporary files left by interrupted writes: "<entry>.json.<pid>.<thread id>.tmp"
+_TMP_NAME = re.compile(r"[0-9a-f]{16}\.json\.\d+\.\d+\.tmp")
+
+# RAM-backed filesystem used for the cache when URLCache(use_shm=True)
+_SHM_DIR = Path("/dev/shm")
+
+# Environment variable that opts into the tmpfs cache when use_shm is not given
+SHM_ENV_VAR = "PURL2SRC_CACHE_SHM"
+
+
+def _is_private_dir(path: Path) -> bool:
+    """Return True if path is a real directory owned by us and not writable by others."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def _default_cache_dir(use_shm: bool) -> Path:
+    """Return the default cache directory, on tmpfs if requested and available."""
+    if use_shm and _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK):
+        # The name is predictable in a world-writable directory, so only use it if
+        # we created it or it is already ours and private; otherwise another user
+        # could seed cache entries
+        shm_dir = _SHM_DIR / f"purl2src-{os.getuid()}"
+        with suppress(OSError):
+            shm_dir.mkdir(mode=0o700)
+        if _is_private_dir(shm_dir):
+            return shm_dir
+    return Path.home() / ".cache" / "purl2src"
+
+
+@lru_cache(maxsize=4096)
+def _hash_purl(purl: str) -> str:
+    """Return the cache file stem for a PURL, memoized across cache instances."""
+    # Use hash to avoid filesystem issues with special characters; the digest is
+    # only a file name, so the faster blake2b is used with a 16 hex character output
+    return hashlib.blake2b(purl.encode(), digest_size=8).hexdigest()
+
 
 class URLCache:
     """Simple file-based cache for resolved URLs."""
 
-    def __init__(self, cache_dir: Optional[Path] = None, ttl: int = 3600):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: int = 3600,
+        max_entries: int = 1024,
+        use_shm: Optional[bool] = None,
+    ):
         """
         Initialize cache.
 
         Args:
             cache_dir: Directory to store cache files (default: ~/.cache/purl2src)
             ttl: Time to live in seconds (default: 1 hour)
+            max_entries: Maximum number of entries kept in memory (default: 1024)
+            use_shm: Default to a per-user directory under /dev/shm when it is writable,
+                for fast but non-persistent caching (default: enabled when the
+                PURL2SRC_CACHE_SHM environment variable is set to 1, true, yes or on)
         """
+        if use_shm is None:
+            use_shm = os.environ.get(SHM_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
         if cache_dir is None:
-            cache_dir = Path.home() / ".cache" / "purl2src"
+            cache_dir = _default_cache_dir(use_shm)
 
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = ttl
+        self.max_entries = max_entries
 
         # In-memory LRU cache for faster access
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Guards the LRU bookkeeping, which spans several OrderedDict operations
+        self._memory_lock = threading.Lock()
 
     def _get_cache_path(self, purl: str) -> Path:
         """Get cache file path for a PURL."""
-        # Use hash to avoid filesystem issues with special characters
-        import hashlib
+        return self.cache_dir / f"{_hash_purl(purl)}.json"
 
-        purl_hash = hashlib.sha256(purl.encode()).hexdigest()[:16]
-        return self.cache_dir / f"{purl_hash}.json"
+    def _remember(self, purl: str, entry: Dict[str, Any]) -> None:
+        """Store an entry in the memory cache, evicting the least recently used."""
+        with self._memory_lock:
+            self._memory_cache[purl] = entry
+            self._memory_cache.move_to_end(purl)
+            if len(self._memory_cache) > self.max_entries:
+                self._memory_cache.popitem(last=False)
 
     def get(self, purl: str) -> Optional[Dict[str, Any]]:
         """
@@ -47,9 +142,13 @@ class URLCache:
             Cached result or None if not found/expired
         """
         # Check memory cache first
-        if purl in self._memory_cache:
-            entry = self._memory_cache[purl]
-            if time.time() - entry["timestamp"] < self.ttl:
+        with self._memory_lock:
+            entry = self._memory_cache.get(purl)
+            if (
+                entry is not None
+                and time.time_ns() - entry["timestamp"] < self.ttl * _NS_PER_SECOND
+            ):
+                self._memory_cache.move_to_end(purl)
                 data: Optional[Dict[str, Any]] = entry["data"]
                 return data
 
@@ -59,21 +158,20 @@ class URLCache:
             return None
 
         try:
-            with open(cache_path, "r") as f:
-                entry = json.load(f)
+            entry = _loads(cache_path.read_bytes())
 
             # Check if expired
-            if time.time() - entry["timestamp"] > self.ttl:
+            if time.time_ns() - entry["timestamp"] > self.ttl * _NS_PER_SECOND:
                 cache_path.unlink()  # Delete expired entry
                 return None
 
             # Update memory cache
-            self._memory_cache[purl] = entry
+            self._remember(purl, entry)
             cache_data: Optional[Dict[str, Any]] = entry["data"]
             return cache_data
 
-        except (json.JSONDecodeError, KeyError, IOError):
-            # Invalid cache entry, remove it
+        except (ValueError, KeyError, IOError):
+            # Invalid cache entry (ValueError covers either parser's decode error), remove it
             cache_path.unlink(missing_ok=True)
             return None
 
@@ -85,24 +183,36 @@ class URLCache:
             purl: Package URL string
             data: Data to cache
         """
-        entry = {"timestamp": time.time(), "data": data}
+        entry = {"timestamp": time.time_ns(), "data": data}
 
         # Update memory cache
-        self._memory_cache[purl] = entry
+        self._remember(purl, entry)
 
-        # Write to file cache
+        # Write to file cache via a per-writer temporary file renamed into place, so
+        # readers never see a partially written entry
         cache_path = self._get_cache_path(purl)
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         try:
-            with open(cache_path, "w") as f:
-                json.dump(entry, f)
+            tmp_path.write_bytes(_dumps(entry))
+            os.replace(tmp_path, cache_path)
         except IOError:
-            # Ignore cache write errors
-            pass
+            # Ignore cache write errors, cleaning up the temporary file if possible
+            with suppress(IOError):
+                tmp_path.unlink()
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self._memory_cache.clear()
-
-        # Remove all cache files
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink(missing_ok=True)
+        with self._memory_lock:
+            self._memory_cache.clear()
+
+        # Remove only our own cache and temporary files; cache_dir may be shared
+        # with other data
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") or _TMP_NAME.fullmatch(entry.name):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
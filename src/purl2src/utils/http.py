@@ -1,31 +1,99 @@
 """HTTP client utilities with connection pooling."""
 
 import hashlib
-from typing import Optional, Dict, Any
+import hmac
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .. import __version__
+
+try:
+    import orjson
+
+    def _loads(raw: bytes) -> Any:
+        """Parse a JSON response body using orjson."""
+        return orjson.loads(raw)
+
+except ImportError:  # pragma: no cover - optional dependency
+
+    def _loads(raw: bytes) -> Any:
+        """Parse a JSON response body using the standard library."""
+        return json.loads(raw)
+
+
+try:
+    import xxhash  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None  # type: ignore[assignment]
+
+# Status codes returned by servers that do not implement HEAD
+HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+
+# Bytes read per iteration when downloading; large enough that hashing, not the
+# Python loop, dominates the cost
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Distinct registry hosts kept in the pool, and keep-alive connections per host;
+# sized so a large --jobs batch against one registry reuses its connections
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 100
+
+# Headers sent with every request; copied into each client's session
+_DEFAULT_HEADERS = {"User-Agent": f"purl2src/{__version__}"}
+
+
+def _new_hasher(algorithm: str) -> Any:
+    """Create a hash object, using xxhash for xxh* algorithms when it is installed."""
+    if xxhash is not None and algorithm.startswith("xxh"):
+        constructor = getattr(xxhash, algorithm, None)
+        if constructor is not None:
+            return constructor()
+    return hashlib.new(algorithm)
+
 
 class HttpClient:
     """HTTP client with connection pooling and retry logic."""
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3, etag_cache_size: int = 0):
+        """
+        Initialize the client.
+
+        Args:
+            timeout: Request timeout in seconds (default: 30)
+            max_retries: Retries for connection errors and 429/5xx responses (default: 3)
+            etag_cache_size: Number of get_json responses kept for ETag revalidation;
+                0 disables it (default: 0)
+        """
         self.timeout = timeout
         self.session = requests.Session()
 
+        # Raw get_json bodies keyed by (url, Accept header), revalidated with If-None-Match
+        self.etag_cache_size = etag_cache_size
+        self._etag_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[str, bytes]]"
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+
         # Configure retry strategy
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=20)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
         # Set default headers
-        self.session.headers.update({"User-Agent": "purl2src/0.1.0"})
+        self.session.headers.update(_DEFAULT_HEADERS)
 
     def get(self, url: str, **kwargs: Any) -> requests.Response:
         """Perform GET request."""
@@ -41,6 +109,9 @@ class HttpClient:
         """
         Validate that a URL is accessible.
 
+        Uses a HEAD request so no body is transferred. Servers that reject HEAD
+        are retried with a streamed GET that is closed without reading the body.
+
         Args:
             url: URL to validate
 
@@ -49,6 +120,9 @@ class HttpClient:
         """
         try:
             response = self.head(url, allow_redirects=True)
+            if response.status_code in HEAD_UNSUPPORTED_STATUSES:
+                with self.get(url, allow_redirects=True, stream=True) as response:
+                    return response.status_code == 200
             return response.status_code == 200
         except requests.RequestException:
             return False
@@ -62,23 +136,35 @@ class HttpClient:
         Args:
             url: URL to download
             expected_checksum: Expected checksum value
-            algorithm: Hash algorithm (default: sha256)
+            algorithm: Hash algorithm (default: sha256); xxh64, xxh3_64 and xxh3_128
+                are supported when the optional xxhash package is installed
 
         Returns:
             Downloaded content as bytes
 
         Raises:
-            ValueError: If checksum doesn't match
+            ValueError: If the expected checksum is not hex, or the checksum doesn't match
             requests.RequestException: If download fails
         """
+        # Decode the expected digest up front so a malformed checksum fails before
+        # downloading; comparing bytes also makes the check case-insensitive
+        expected_digest = None
+        if expected_checksum:
+            try:
+                expected_digest = bytes.fromhex(expected_checksum)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid expected checksum {expected_checksum!r}: not a hex digest"
+                ) from None
+
         response = self.get(url, stream=True)
         response.raise_for_status()
 
         # Download in chunks and calculate hash
-        hasher = hashlib.new(algorithm)
+        hasher = _new_hasher(algorithm)
         content_chunks = []
 
-        for chunk in response.iter_content(chunk_size=8192):
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
             if chunk:
                 hasher.update(chunk)
                 content_chunks.append(chunk)
@@ -86,12 +172,12 @@ class HttpClient:
         content = b"".join(content_chunks)
 
         # Verify checksum if provided
-        if expected_checksum:
-            actual_checksum = hasher.hexdigest()
-            if actual_checksum.lower() != expected_checksum.lower():
-                raise ValueError(
-                    f"Checksum mismatch: expected {expected_checksum}, " f"got {actual_checksum}"
-                )
+        if expected_digest is not None and not hmac.compare_digest(
+            hasher.digest(), expected_digest
+        ):
+            raise ValueError(
+                f"Checksum mismatch: expected {expected_checksum}, got {hasher.hexdigest()}"
+            )
 
         return content
 
@@ -99,6 +185,10 @@ class HttpClient:
         """
         Get JSON response from URL.
 
+        With etag_cache_size set, a response that carried an ETag is revalidated
+        with If-None-Match and reused when the server answers 304 Not Modified.
+        The stored body is parsed again on reuse, so callers never share a result.
+
         Args:
             url: URL to fetch
             **kwargs: Additional arguments for requests.get
@@ -110,9 +200,39 @@ class HttpClient:
             requests.RequestException: If request fails
             json.JSONDecodeError: If response is not valid JSON
         """
-        response = self.get(url, **kwargs)
+        if not self.etag_cache_size:
+            response = self.get(url, **kwargs)
+            response.raise_for_status()
+            result: Dict[str, Any] = _loads(response.content)
+            return result
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        key = (url, headers.get("Accept"))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        response = self.get(url, headers=headers, **kwargs)
+        if response.status_code == 304:
+            if cached is not None:
+                result = _loads(cached[1])
+                return result
+            # Nothing to reuse (e.g. a caller-supplied If-None-Match); fetch the body
+            headers = {k: v for k, v in headers.items() if k != "If-None-Match"}
+            response = self.get(url, headers=headers, **kwargs)
         response.raise_for_status()
-        result: Dict[str, Any] = response.json()
+        result = _loads(response.content)
+
+        etag = response.headers.get("ETag")
+        with self._etag_lock:
+            if etag:
+                self._etag_cache[key] = (etag, response.content)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > self.etag_cache_size:
+                    self._etag_cache.popitem(last=False)
+            else:
+                self._etag_cache.pop(key, None)
         return result
 
     def close(self) -> None:
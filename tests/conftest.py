@@ -0,0 +1,13 @@
+"""Shared pytest configuration."""
+
+import shutil
+
+import pytest
+
+from purl2src.handlers import base
+
+
+@pytest.fixture(autouse=True)
+def uncached_which(monkeypatch):
+    """Bypass the PATH lookup cache so tests can swap shutil.which freely."""
+    monkeypatch.setattr(base, "_which_cached", lambda cmd: shutil.which(cmd))
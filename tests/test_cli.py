@@ -2,9 +2,12 @@
 
 import json
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -83,6 +86,23 @@ class TestCLI:
         )
         assert output_json[0]["status"] == "success"
 
+    @patch("purl2src.cli.get_download_url")
+    def test_json_format_writes_non_ascii_as_utf8(self, mock_get_url):
+        """Test JSON output keeps non-ASCII characters unescaped, with or without orjson."""
+        purl = "pkg:npm/caf\u00e9@1.0?note=\u4e2d\u6587"
+        mock_get_url.return_value = HandlerResult(
+            purl=purl,
+            download_url="https://example.com/r\u00e9sum\u00e9 \U0001f600 \x7f \x1f \u2028.tgz",
+            validated=True,
+            method="direct",
+        )
+
+        result = self.runner.invoke(main, [purl, "--format", "json"])
+
+        assert result.exit_code == 0
+        expected = json.dumps([mock_get_url.return_value.to_dict()], indent=2, ensure_ascii=False)
+        assert result.output.rstrip("\n") == expected
+
     @patch("purl2src.cli.get_download_url")
     def test_single_purl_success_csv_format(self, mock_get_url):
         """Test processing single PURL with CSV output format."""
@@ -197,6 +217,26 @@ class TestCLI:
         finally:
             Path(output_file).unlink()
 
+    @patch("purl2src.cli.get_download_url")
+    def test_batch_output_to_file_streams_valid_json(self, mock_get_url):
+        """Test batch results streamed to a file form a single JSON array."""
+        mock_get_url.side_effect = lambda purl, validate=True: (
+            self.success_result if "express" in purl else self.failed_result
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = Path(temp_dir) / "purls.txt"
+            input_file.write_text("pkg:npm/express@4.17.1\npkg:npm/nonexistent@1.0.0\n")
+            output_file = Path(temp_dir) / "results.json"
+
+            result = self.runner.invoke(
+                main, ["--file", str(input_file), "--output", str(output_file), "--format", "json"]
+            )
+
+            assert result.exit_code == 1
+            content = json.loads(output_file.read_text())
+            assert content == [self.success_result.to_dict(), self.failed_result.to_dict()]
+
     @patch("purl2src.cli.get_download_url")
     def test_verbose_mode_with_multiple_purls(self, mock_get_url):
         """Test verbose mode with multiple PURLs shows progress."""
@@ -212,11 +252,7 @@ class TestCLI:
             # Mock the progress bar to avoid Click's context manager requirement in tests
             with patch("click.progressbar") as mock_progressbar:
                 mock_context = MagicMock()
-                mock_context.__enter__.return_value = [
-                    "pkg:npm/express@4.17.1",
-                    "pkg:npm/lodash@4.17.21",
-                    "pkg:npm/react@17.0.2",
-                ]
+                mock_bar = mock_context.__enter__.return_value
                 mock_context.__exit__.return_value = None
                 mock_progressbar.return_value = mock_context
 
@@ -225,10 +261,27 @@ class TestCLI:
                 assert result.exit_code == 0
                 # Should have called progressbar with verbose mode
                 mock_progressbar.assert_called_once()
+                assert mock_progressbar.call_args.kwargs["update_min_steps"] == 1
+                assert mock_progressbar.call_args.kwargs["length"] == 3
+                # The bar advances once per result, including the last one
+                assert mock_bar.update.call_args_list == [call(1)] * 3
 
         finally:
             Path(temp_file).unlink()
 
+    @patch("purl2src.cli.get_download_url")
+    def test_verbose_progress_redraw_is_throttled(self, mock_get_url, tmp_path):
+        """Test the progress bar redraws at most about 100 times for large batches."""
+        mock_get_url.return_value = self.success_result
+        purl_file = tmp_path / "purls.txt"
+        purl_file.write_text("".join(f"pkg:npm/pkg{i}@1.0.0\n" for i in range(250)))
+
+        with patch("click.progressbar", wraps=click.progressbar) as mock_progressbar:
+            result = self.runner.invoke(main, ["--file", str(purl_file), "--verbose"])
+
+        assert result.exit_code == 0
+        assert mock_progressbar.call_args.kwargs["update_min_steps"] == 2
+
     @patch("purl2src.cli.get_download_url")
     def test_verbose_mode_with_errors(self, mock_get_url):
         """Test verbose mode shows error count."""
@@ -271,8 +324,11 @@ class TestCLI:
     @patch("purl2src.cli.get_download_url")
     def test_mixed_success_and_failure(self, mock_get_url):
         """Test processing with mixed success and failure results."""
-        results = [self.success_result, self.failed_result]
-        mock_get_url.side_effect = results
+        results = {
+            "pkg:npm/express@4.17.1": self.success_result,
+            "pkg:npm/nonexistent@1.0.0": self.failed_result,
+        }
+        mock_get_url.side_effect = lambda purl, validate=True: results[purl]
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
             f.write("pkg:npm/express@4.17.1\n")
@@ -296,6 +352,86 @@ class TestCLI:
         finally:
             Path(temp_file).unlink()
 
+    @patch("purl2src.cli.get_download_url")
+    def test_batch_preserves_input_order(self, mock_get_url):
+        """Test concurrent batch processing reports results in input order."""
+        purls = [f"pkg:npm/package{i}@1.0.0" for i in range(20)]
+
+        def mock_side_effect(purl, validate=True):
+            # Resolve later PURLs faster so completion order differs from input order
+            time.sleep((len(purls) - int(purl.split("package")[1].split("@")[0])) * 0.001)
+            return HandlerResult(
+                purl=purl,
+                download_url=f"https://example.com/{purl}.tgz",
+                validated=validate,
+                method="direct",
+            )
+
+        mock_get_url.side_effect = mock_side_effect
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            f.write("\n".join(purls))
+            temp_file = f.name
+
+        try:
+            result = self.runner.invoke(main, ["--file", temp_file, "--format", "json", "-j", "4"])
+
+            assert result.exit_code == 0
+            output_json = json.loads(result.output)
+            assert [item["purl"] for item in output_json] == purls
+            assert mock_get_url.call_count == len(purls)
+
+        finally:
+            Path(temp_file).unlink()
+
+    def test_processes_option_shards_batch(self, tmp_path, monkeypatch):
+        """Test --processes shards batches across worker processes and keeps input order."""
+        # Worker processes resolve for real; keep their cache out of the user's home
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+        monkeypatch.delenv("PURL2SRC_CACHE_SHM", raising=False)
+        purls = [f"pkg:cargo/crate{i}@1.0.0" for i in range(7)]
+        purl_file = tmp_path / "purls.txt"
+        purl_file.write_text("\n".join(purls))
+
+        with patch("purl2src.cli.PROCESS_CHUNK_SIZE", 3), patch(
+            "purl2src.cli.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mock_pool:
+            result = self.runner.invoke(
+                main,
+                ["--file", str(purl_file), "--format", "json", "--no-validate", "--processes", "2"],
+            )
+
+        assert result.exit_code == 0
+        mock_pool.assert_called_once_with(max_workers=2)
+        output_json = json.loads(result.output)
+        assert [item["purl"] for item in output_json] == purls
+        assert all(item["method"] == "direct" for item in output_json)
+        assert (tmp_path / ".cache" / "purl2src").is_dir()
+
+    @patch("purl2src.cli.ProcessPoolExecutor")
+    @patch("purl2src.cli.get_download_url")
+    def test_large_batch_uses_threads_by_default(self, mock_get_url, mock_pool):
+        """Test batches stay in the thread pool unless --processes is given."""
+        mock_get_url.side_effect = lambda purl, validate: HandlerResult(
+            purl=purl, download_url="https://example.com/pkg.tgz", validated=False, method="direct"
+        )
+        purls = [f"pkg:npm/pkg{i}@1.0.0" for i in range(300)]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            f.write("\n".join(purls))
+            temp_file = f.name
+
+        try:
+            result = self.runner.invoke(main, ["--file", temp_file, "--format", "json"])
+
+            assert result.exit_code == 0
+            mock_pool.assert_not_called()
+            assert len(json.loads(result.output)) == 300
+
+        finally:
+            Path(temp_file).unlink()
+
     @patch("purl2src.cli.get_download_url")
     def test_csv_output_with_missing_fields(self, mock_get_url):
         """Test CSV output handles missing fields gracefully."""
@@ -317,6 +453,19 @@ class TestCLI:
         assert len(lines) == 2
         assert "pkg:npm/test@1.0.0,https://example.com/test.tgz,success,api" in lines[1]
 
+    @patch("purl2src.cli.get_download_url")
+    def test_csv_output_for_exception(self, mock_get_url):
+        """Test CSV output leaves the URL empty and quotes fields containing commas."""
+        mock_get_url.side_effect = ValueError("Test error")
+
+        result = self.runner.invoke(
+            main, ["pkg:maven/org/pkg@1.0?classifier=a,b", "--format", "csv"]
+        )
+
+        assert result.exit_code == 1
+        lines = result.output.strip().split("\n")
+        assert lines[1] == '"pkg:maven/org/pkg@1.0?classifier=a,b",,failed,'
+
     @patch("purl2src.cli.get_download_url")
     def test_plain_output_with_no_url(self, mock_get_url):
         """Test plain output format when download URL is None."""
@@ -0,0 +1,17 @@
+"""Shared test doubles for handler tests."""
+
+from unittest.mock import Mock
+
+
+class FakeHttpClient:
+    """Lightweight stand-in for HttpClient exposing only the methods handlers call."""
+
+    def __init__(self):
+        self.reset_mock()
+
+    def reset_mock(self):
+        """Discard recorded calls and any behaviour configured by a previous test."""
+        self.validate_url = Mock(return_value=True)
+        self.download_and_verify = Mock()
+        self.get = Mock()
+        self.get_json = Mock()
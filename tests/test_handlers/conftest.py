@@ -0,0 +1,24 @@
+"""Shared fixtures for handler tests."""
+
+import pytest
+
+from ._fakes import FakeHttpClient
+
+
+@pytest.fixture(scope="module")
+def shared_handler(request):
+    """Handler built once per module from its HANDLER_CLS; handlers keep no state."""
+    return request.module.HANDLER_CLS(FakeHttpClient())
+
+
+@pytest.fixture
+def handler(shared_handler):
+    """The module's shared handler, with its FakeHttpClient reset for this test."""
+    shared_handler.http_client.reset_mock()
+    return shared_handler
+
+
+@pytest.fixture
+def http_client(handler):
+    """HTTP client of the shared handler."""
+    return handler.http_client
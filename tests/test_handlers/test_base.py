@@ -1,65 +1,268 @@
 """Tests for base handler class."""
 
 import subprocess
-from unittest.mock import MagicMock, Mock, patch
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
-from purl2src.handlers.base import BaseHandler, HandlerError, HandlerResult
+from purl2src.handlers.base import BaseHandler, HandlerError, HandlerResult, _which_cached
 from purl2src.parser import Purl
-from purl2src.utils.http import HttpClient
+
+from ._fakes import FakeHttpClient
+
+
+class _TestHandler(BaseHandler):
+    """Concrete handler whose behaviour is selected by the package name."""
+
+    def build_download_url(self, purl: Purl):
+        if purl.name == "direct_success":
+            return "https://example.com/direct.tgz"
+        elif purl.name == "direct_fail":
+            return None
+        elif purl.name == "api_success":
+            return None  # Force to try API
+        else:
+            raise Exception("Direct method failed")
+
+    def get_download_url_from_api(self, purl: Purl):
+        if purl.name == "api_success":
+            return "https://example.com/api.tgz"
+        elif purl.name == "api_fail":
+            return None
+        else:
+            raise Exception("API method failed")
+
+    def get_fallback_cmd(self, purl: Purl):
+        if purl.name in [
+            "fallback_success",
+            "fallback_fail",
+            "direct_success",
+            "api_success",
+        ]:
+            return f"echo https://example.com/{purl.name}.tgz"
+        return None
+
+    def get_package_manager_cmd(self):
+        return ["testpm", "alt-testpm"]
+
+    def parse_fallback_output(self, output: str):
+        if "fallback_success" in output:
+            return output.strip()
+        return None
+
+
+class _MinimalHandler(BaseHandler):
+    """Concrete handler that inherits the base parse_fallback_output."""
+
+    def build_download_url(self, purl: Purl):
+        return None
+
+    def get_download_url_from_api(self, purl: Purl):
+        return None
+
+    def get_fallback_cmd(self, purl: Purl):
+        return None
+
+    def get_package_manager_cmd(self):
+        return []
+
+
+class _TrackingHandler(BaseHandler):
+    """Handler that records the order in which resolution methods are called."""
+
+    # URLs returned by the direct and API methods; None forces the next method
+    direct_url = None
+    api_url = None
+
+    def __init__(self, http_client, method_calls):
+        super().__init__(http_client)
+        self.method_calls = method_calls
+
+    def build_download_url(self, purl: Purl):
+        self.method_calls.append("direct")
+        return self.direct_url
+
+    def get_download_url_from_api(self, purl: Purl):
+        self.method_calls.append("api")
+        return self.api_url
+
+    def get_fallback_cmd(self, purl: Purl):
+        self.method_calls.append("fallback_cmd_check")
+        return "testpm download test"  # Return a command to enable fallback
+
+    def get_package_manager_cmd(self):
+        return ["testpm"]
+
+    def execute_fallback_command(self, purl: Purl):
+        self.method_calls.append("fallback_execute")
+        return None  # Force failure
+
+
+class _EarlySuccessHandler(_TrackingHandler):
+    """Tracking handler whose direct method succeeds immediately."""
+
+    direct_url = "https://example.com/direct.tgz"
+    api_url = "https://example.com/api.tgz"
+
+
+# Shared, immutable PURLs for the test package names understood by _TestHandler
+PURLS = {
+    name: Purl(ecosystem="test", name=name, version="1.0.0")
+    for name in (
+        "direct_success",
+        "api_success",
+        "fallback_success",
+        "fallback_fail",
+        "no_fallback",
+        "all_fail",
+        "test",
+    )
+}
+
+# Resolution flow scenarios for _TestHandler: setup inputs and the expected result
+_FLOW_CASES = [
+    dict(
+        id="direct_validated",
+        name="direct_success",
+        validate=True,
+        url="https://example.com/direct.tgz",
+        method="direct",
+        status="success",
+        fallback_available=True,
+    ),
+    dict(
+        id="direct_unvalidated",
+        name="direct_success",
+        validate=False,
+        url="https://example.com/direct.tgz",
+        method="direct",
+        status="success",
+        fallback_available=True,
+    ),
+    dict(
+        id="api",
+        name="api_success",
+        validate=True,
+        url="https://example.com/api.tgz",
+        method="api",
+        status="success",
+        fallback_available=True,
+    ),
+    dict(
+        id="fallback",
+        name="fallback_success",
+        validate=True,
+        stdout="https://example.com/fallback_success.tgz",
+        url="https://example.com/fallback_success.tgz",
+        method="fallback",
+        status="success",
+        fallback_available=True,
+    ),
+    dict(
+        id="package_manager_missing",
+        name="fallback_success",
+        validate=True,
+        which=None,
+        url=None,
+        method="none",
+        status="failed",
+        fallback_available=False,
+    ),
+    dict(
+        id="all_methods_fail",
+        name="all_fail",
+        validate=True,
+        http_validate=False,
+        url=None,
+        method="none",
+        status="failed",
+        fallback_available=False,
+    ),
+    dict(
+        id="fallback_validation_fails",
+        name="fallback_success",
+        validate=True,
+        http_validate=False,
+        stdout="https://example.com/fallback_success.tgz",
+        url=None,
+        method="none",
+        status="failed",
+        fallback_available=True,
+    ),
+    dict(
+        id="fallback_parse_fails",
+        name="fallback_fail",
+        validate=False,
+        stdout="https://example.com/fallback_fail.tgz",
+        url=None,
+        method="none",
+        status="failed",
+        fallback_available=True,
+    ),
+    dict(
+        id="fallback_exception",
+        name="fallback_success",
+        validate=False,
+        run_error=Exception("Unexpected error"),
+        url=None,
+        method="none",
+        status="failed",
+        fallback_available=True,
+    ),
+]
+
+
+class _FakeRun:
+    """Programmable stand-in for subprocess.run that records its calls."""
+
+    def __init__(self):
+        self.result = SimpleNamespace(stdout="")
+        self.side_effect = None
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def fake_run(monkeypatch):
+    """Replace subprocess.run so no fallback command is actually executed."""
+    fake = _FakeRun()
+    monkeypatch.setattr("subprocess.run", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def mock_which(monkeypatch):
+    """Report the test package manager as installed unless a test says otherwise."""
+    mock = MagicMock(return_value="/usr/bin/testpm")
+    monkeypatch.setattr("shutil.which", mock)
+    return mock
+
+
+@pytest.fixture
+def http_client():
+    """Stub HTTP client shared by the handler under test."""
+    return FakeHttpClient()
+
+
+@pytest.fixture
+def handler(http_client):
+    """Test handler wired to the stub HTTP client."""
+    return _TestHandler(http_client)
 
 
 class TestBaseHandler:
     """Test base handler functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.http_client = MagicMock(spec=HttpClient)
-
-        # Create a concrete implementation for testing
-        class TestHandler(BaseHandler):
-            def build_download_url(self, purl: Purl):
-                if purl.name == "direct_success":
-                    return "https://example.com/direct.tgz"
-                elif purl.name == "direct_fail":
-                    return None
-                elif purl.name == "api_success":
-                    return None  # Force to try API
-                else:
-                    raise Exception("Direct method failed")
-
-            def get_download_url_from_api(self, purl: Purl):
-                if purl.name == "api_success":
-                    return "https://example.com/api.tgz"
-                elif purl.name == "api_fail":
-                    return None
-                else:
-                    raise Exception("API method failed")
-
-            def get_fallback_cmd(self, purl: Purl):
-                if purl.name in [
-                    "fallback_success",
-                    "fallback_fail",
-                    "direct_success",
-                    "api_success",
-                ]:
-                    return f"echo https://example.com/{purl.name}.tgz"
-                return None
-
-            def get_package_manager_cmd(self):
-                return ["testpm", "alt-testpm"]
-
-            def parse_fallback_output(self, output: str):
-                if "fallback_success" in output:
-                    return output.strip()
-                return None
-
-        self.handler = TestHandler(self.http_client)
-
-    def test_handler_initialization(self):
+    def test_handler_initialization(self, handler, http_client):
         """Test handler initialization."""
-        assert self.handler.http_client == self.http_client
+        assert handler.http_client == http_client
 
     def test_handler_result_creation(self):
         """Test HandlerResult creation and conversion."""
@@ -84,6 +287,19 @@ class TestBaseHandler:
         assert result_dict["download_url"] == "https://example.com/package.tgz"
         assert "error" not in result_dict  # None values should be filtered out
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+    def test_handler_result_uses_slots(self):
+        """Test HandlerResult instances do not carry a per-instance __dict__."""
+        result = HandlerResult(
+            purl="pkg:test/package@1.0.0",
+            download_url=None,
+            validated=False,
+            method="none",
+        )
+
+        assert not hasattr(result, "__dict__")
+        assert result.to_dict()["status"] == "success"
+
     def test_handler_result_with_none_values(self):
         """Test HandlerResult filters out None values in to_dict."""
         result = HandlerResult(
@@ -99,223 +315,147 @@ class TestBaseHandler:
         assert "download_url" not in result_dict
         assert result_dict["error"] == "Failed to resolve"
 
-    @patch("shutil.which")
-    def test_direct_url_success_with_validation(self, mock_which):
-        """Test successful direct URL resolution with validation."""
-        mock_which.return_value = "/usr/bin/testpm"
-        self.http_client.validate_url.return_value = True
+    @pytest.mark.parametrize("case", _FLOW_CASES, ids=lambda case: case["id"])
+    def test_get_download_url_flow(self, case, handler, http_client, mock_which, fake_run):
+        """Test the direct -> api -> fallback resolution flow."""
+        mock_which.return_value = case.get("which", "/usr/bin/testpm")
+        http_client.validate_url.return_value = case.get("http_validate", True)
+        fake_run.result.stdout = case.get("stdout", "")
+        fake_run.side_effect = case.get("run_error")
 
-        purl = Purl(ecosystem="test", name="direct_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=True)
+        purl = PURLS[case["name"]]
+        result = handler.get_download_url(purl, validate=case["validate"])
 
         assert result.purl == str(purl)
-        assert result.download_url == "https://example.com/direct.tgz"
-        assert result.validated is True
-        assert result.method == "direct"
-        assert result.status == "success"
-        assert result.fallback_available is True
-
-        self.http_client.validate_url.assert_called_once_with("https://example.com/direct.tgz")
-
-    @patch("shutil.which")
-    def test_direct_url_success_without_validation(self, mock_which):
-        """Test successful direct URL resolution without validation."""
-        mock_which.return_value = "/usr/bin/testpm"
-
-        purl = Purl(ecosystem="test", name="direct_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=False)
-
-        assert result.download_url == "https://example.com/direct.tgz"
-        assert result.validated is False
-        assert result.method == "direct"
-        assert result.status == "success"
-
-        self.http_client.validate_url.assert_not_called()
-
-    @patch("shutil.which")
-    def test_direct_url_validation_fails(self, mock_which):
+        assert result.download_url == case["url"]
+        assert result.method == case["method"]
+        assert result.status == case["status"]
+        assert result.validated is (case["validate"] and case["url"] is not None)
+        assert result.fallback_available is case["fallback_available"]
+        if case["url"] is None:
+            assert result.error == "Failed to resolve download URL"
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_direct_url_validation_call(self, validate, handler, http_client):
+        """Test the direct URL is validated only when requested."""
+        purl = PURLS["direct_success"]
+        handler.get_download_url(purl, validate=validate)
+
+        if validate:
+            http_client.validate_url.assert_called_once_with("https://example.com/direct.tgz")
+        else:
+            http_client.validate_url.assert_not_called()
+
+    def test_fallback_command_invocation(self, handler, fake_run):
+        """Test the fallback command is run with output capture and a timeout."""
+        fake_run.result.stdout = "https://example.com/fallback_success.tgz"
+
+        purl = PURLS["fallback_success"]
+        handler.get_download_url(purl, validate=True)
+
+        assert len(fake_run.calls) == 1
+        _, kwargs = fake_run.calls[0]
+        assert kwargs["capture_output"] is True
+        assert kwargs["text"] is True
+        assert kwargs["timeout"] == 30
+        assert kwargs["check"] is True
+
+    def test_direct_url_validation_fails(self, handler, http_client):
         """Test direct URL validation fails, falls back to API."""
-        mock_which.return_value = "/usr/bin/testpm"
-
         # Create a PURL that will return a URL from direct method but fail validation
         # This should cause it to fall back to API
-        purl = Purl(ecosystem="test", name="direct_success", version="1.0.0")
+        purl = PURLS["direct_success"]
 
         # Mock validation to fail for direct URL, then succeed for API URL
-        self.http_client.validate_url.side_effect = [False, True]
+        http_client.validate_url.side_effect = [False, True]
 
         # Override the test handler to also provide API method for this PURL
-        original_api_method = self.handler.get_download_url_from_api
+        original_api_method = handler.get_download_url_from_api
 
         def mock_api_method(p):
             if p.name == "direct_success":
                 return "https://example.com/api.tgz"
             return original_api_method(p)
 
-        self.handler.get_download_url_from_api = mock_api_method
-
-        result = self.handler.get_download_url(purl, validate=True)
-
-        assert result.download_url == "https://example.com/api.tgz"
-        assert result.method == "api"
-        assert result.status == "success"
-
-    @patch("shutil.which")
-    def test_api_fallback_success(self, mock_which):
-        """Test API method success when direct fails."""
-        mock_which.return_value = "/usr/bin/testpm"
-        self.http_client.validate_url.return_value = True
+        handler.get_download_url_from_api = mock_api_method
 
-        purl = Purl(ecosystem="test", name="api_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=True)
+        result = handler.get_download_url(purl, validate=True)
 
         assert result.download_url == "https://example.com/api.tgz"
         assert result.method == "api"
         assert result.status == "success"
 
-    @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_fallback_command_success(self, mock_run, mock_which):
-        """Test package manager fallback success."""
-        mock_which.return_value = "/usr/bin/testpm"
-
-        # Setup subprocess mock
-        mock_result = Mock()
-        mock_result.stdout = "https://example.com/fallback_success.tgz"
-        mock_run.return_value = mock_result
-
-        self.http_client.validate_url.return_value = True
-
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=True)
-
-        assert result.download_url == "https://example.com/fallback_success.tgz"
-        assert result.method == "fallback"
-        assert result.status == "success"
-
-        # Verify subprocess was called correctly
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        assert call_args[1]["capture_output"] is True
-        assert call_args[1]["text"] is True
-        assert call_args[1]["timeout"] == 30
-        assert call_args[1]["check"] is True
-
-    @patch("shutil.which")
-    def test_package_manager_not_available(self, mock_which):
-        """Test when package manager is not available."""
-        mock_which.return_value = None  # Package manager not found
-
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=True)
-
-        assert result.download_url is None
-        assert result.method == "none"
-        assert result.status == "failed"
-        assert result.fallback_available is False
-        assert result.error == "Failed to resolve download URL"
-
-    @patch("shutil.which")
-    def test_all_methods_fail(self, mock_which):
-        """Test when all resolution methods fail."""
-        mock_which.return_value = "/usr/bin/testpm"
-        self.http_client.validate_url.return_value = False
-
-        purl = Purl(ecosystem="test", name="all_fail", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=True)
-
-        assert result.download_url is None
-        assert result.method == "none"
-        assert result.status == "failed"
-        assert result.error == "Failed to resolve download URL"
-
-    def test_is_package_manager_available_found(self):
+    def test_is_package_manager_available_found(self, handler, mock_which):
         """Test package manager availability check when found."""
-        with patch("shutil.which") as mock_which:
-            mock_which.side_effect = lambda cmd: "/usr/bin/testpm" if cmd == "testpm" else None
+        mock_which.side_effect = lambda cmd: "/usr/bin/testpm" if cmd == "testpm" else None
 
-            assert self.handler.is_package_manager_available() is True
-            mock_which.assert_called_with("testpm")
+        assert handler.is_package_manager_available() is True
+        mock_which.assert_called_with("testpm")
 
-    def test_is_package_manager_available_alternative_found(self):
+    def test_is_package_manager_available_alternative_found(self, handler, mock_which):
         """Test package manager availability check with alternative command."""
-        with patch("shutil.which") as mock_which:
-            mock_which.side_effect = lambda cmd: (
-                "/usr/bin/alt-testpm" if cmd == "alt-testpm" else None
-            )
+        mock_which.side_effect = lambda cmd: "/usr/bin/alt-testpm" if cmd == "alt-testpm" else None
 
-            assert self.handler.is_package_manager_available() is True
-            # Should check both commands
-            assert mock_which.call_count == 2
+        assert handler.is_package_manager_available() is True
+        # Should check both commands
+        assert mock_which.call_count == 2
 
-    def test_is_package_manager_available_not_found(self):
+    def test_is_package_manager_available_not_found(self, handler, mock_which):
         """Test package manager availability check when not found."""
-        with patch("shutil.which") as mock_which:
-            mock_which.return_value = None
+        mock_which.return_value = None
 
-            assert self.handler.is_package_manager_available() is False
+        assert handler.is_package_manager_available() is False
 
-    @patch("subprocess.run")
-    def test_execute_fallback_command_success(self, mock_run):
+    def test_which_lookup_is_cached(self, mock_which):
+        """Test each command is looked up on PATH only once."""
+        _which_cached.cache_clear()
+        try:
+            assert _which_cached("testpm") == "/usr/bin/testpm"
+            assert _which_cached("testpm") == "/usr/bin/testpm"
+            mock_which.assert_called_once_with("testpm")
+        finally:
+            _which_cached.cache_clear()
+
+    def test_execute_fallback_command_success(self, handler, fake_run):
         """Test successful fallback command execution."""
-        mock_result = Mock()
-        mock_result.stdout = "https://example.com/fallback_success.tgz"
-        mock_run.return_value = mock_result
+        fake_run.result.stdout = "https://example.com/fallback_success.tgz"
 
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
-        result = self.handler.execute_fallback_command(purl)
+        purl = PURLS["fallback_success"]
+        result = handler.execute_fallback_command(purl)
 
         assert result == "https://example.com/fallback_success.tgz"
 
-    @patch("subprocess.run")
-    def test_execute_fallback_command_timeout(self, mock_run):
+    def test_execute_fallback_command_timeout(self, handler, fake_run):
         """Test fallback command timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired("testpm", 30)
+        fake_run.side_effect = subprocess.TimeoutExpired("testpm", 30)
 
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
+        purl = PURLS["fallback_success"]
 
         with pytest.raises(HandlerError, match="Command timed out"):
-            self.handler.execute_fallback_command(purl)
+            handler.execute_fallback_command(purl)
 
-    @patch("subprocess.run")
-    def test_execute_fallback_command_error(self, mock_run):
+    def test_execute_fallback_command_error(self, handler, fake_run):
         """Test fallback command execution error."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "testpm", stderr="Command failed")
+        fake_run.side_effect = subprocess.CalledProcessError(1, "testpm", stderr="Command failed")
 
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
+        purl = PURLS["fallback_success"]
 
         with pytest.raises(HandlerError, match="Command failed"):
-            self.handler.execute_fallback_command(purl)
+            handler.execute_fallback_command(purl)
 
-    def test_execute_fallback_command_no_command(self):
+    def test_execute_fallback_command_no_command(self, handler):
         """Test fallback command execution with no command."""
-        purl = Purl(ecosystem="test", name="no_fallback", version="1.0.0")
-        result = self.handler.execute_fallback_command(purl)
+        purl = PURLS["no_fallback"]
+        result = handler.execute_fallback_command(purl)
 
         assert result is None
 
-    def test_parse_fallback_output_base_implementation(self):
+    def test_parse_fallback_output_base_implementation(self, http_client):
         """Test base implementation of parse_fallback_output returns None."""
         # Test the actual base implementation through our test handler
         # by calling the method directly (not through the polymorphic get_download_url)
 
-        # Create a minimal concrete handler that uses base implementation
-        class MinimalHandler(BaseHandler):
-            def build_download_url(self, purl: Purl):
-                return None
-
-            def get_download_url_from_api(self, purl: Purl):
-                return None
-
-            def get_fallback_cmd(self, purl: Purl):
-                return None
-
-            def get_package_manager_cmd(self):
-                return []
-
-            # Inherit base parse_fallback_output (doesn't override)
-
-        handler = MinimalHandler(self.http_client)
+        handler = _MinimalHandler(http_client)
         result = handler.parse_fallback_output("some output")
         assert result is None
 
@@ -325,143 +465,53 @@ class TestBaseHandler:
         assert str(error) == "Test error message"
         assert isinstance(error, Exception)
 
-    @patch("shutil.which")
-    def test_fallback_available_calculation(self, mock_which):
+    def test_fallback_available_calculation(self, mock_which, handler):
         """Test fallback_available field calculation."""
         # Test with package manager available and fallback command
         mock_which.return_value = "/usr/bin/testpm"
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=False)
+        purl = PURLS["fallback_success"]
+        result = handler.get_download_url(purl, validate=False)
         assert result.fallback_available is True
 
         # Test with no package manager
         mock_which.return_value = None
-        result = self.handler.get_download_url(purl, validate=False)
+        result = handler.get_download_url(purl, validate=False)
         assert result.fallback_available is False
 
         # Test with package manager but no fallback command
         mock_which.return_value = "/usr/bin/testpm"
-        purl_no_fallback = Purl(ecosystem="test", name="no_fallback", version="1.0.0")
-        result = self.handler.get_download_url(purl_no_fallback, validate=False)
+        purl_no_fallback = PURLS["no_fallback"]
+        result = handler.get_download_url(purl_no_fallback, validate=False)
         assert result.fallback_available is False
 
-    @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_fallback_command_validation_fails(self, mock_run, mock_which):
-        """Test fallback command succeeds but validation fails."""
-        mock_which.return_value = "/usr/bin/testpm"
-
-        mock_result = Mock()
-        mock_result.stdout = "https://example.com/fallback_success.tgz"
-        mock_run.return_value = mock_result
-
-        self.http_client.validate_url.return_value = False
-
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=True)
-
-        assert result.download_url is None
-        assert result.method == "none"
-        assert result.status == "failed"
-
-    @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_fallback_command_parse_fails(self, mock_run, mock_which):
-        """Test fallback command executes but parsing fails."""
-        mock_which.return_value = "/usr/bin/testpm"
-
-        mock_result = Mock()
-        mock_result.stdout = "https://example.com/fallback_fail.tgz"  # Will return None from parse
-        mock_run.return_value = mock_result
-
-        purl = Purl(ecosystem="test", name="fallback_fail", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=False)
-
-        assert result.download_url is None
-        assert result.method == "none"
-        assert result.status == "failed"
-
-    @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_fallback_command_exception(self, mock_run, mock_which):
-        """Test fallback command raises exception during execution."""
-        mock_which.return_value = "/usr/bin/testpm"
-        mock_run.side_effect = Exception("Unexpected error")
-
-        purl = Purl(ecosystem="test", name="fallback_success", version="1.0.0")
-        result = self.handler.get_download_url(purl, validate=False)
-
-        assert result.download_url is None
-        assert result.method == "none"
-        assert result.status == "failed"
-
-    def test_abstract_methods_not_implemented(self):
+    def test_abstract_methods_not_implemented(self, http_client):
         """Test that abstract methods must be implemented."""
         # BaseHandler can't be instantiated directly due to abstract methods
         with pytest.raises(TypeError):
-            BaseHandler(self.http_client)
+            BaseHandler(http_client)
 
-    @patch("shutil.which")
-    def test_method_order_priority(self, mock_which):
+    def test_method_order_priority(self, http_client):
         """Test that methods are tried in correct order: direct -> api -> fallback."""
-        mock_which.return_value = "/usr/bin/testpm"
-
-        # Create a handler that tracks method calls
         method_calls = []
-
-        class TrackingHandler(BaseHandler):
-            def build_download_url(self, purl: Purl):
-                method_calls.append("direct")
-                return None  # Force fallback to next method
-
-            def get_download_url_from_api(self, purl: Purl):
-                method_calls.append("api")
-                return None  # Force fallback to next method
-
-            def get_fallback_cmd(self, purl: Purl):
-                method_calls.append("fallback_cmd_check")
-                return "testpm download test"  # Return a command to enable fallback
-
-            def get_package_manager_cmd(self):
-                return ["testpm"]
-
-            def execute_fallback_command(self, purl: Purl):
-                method_calls.append("fallback_execute")
-                return None  # Force failure
-
-        tracking_handler = TrackingHandler(self.http_client)
-        purl = Purl(ecosystem="test", name="test", version="1.0.0")
+        tracking_handler = _TrackingHandler(http_client, method_calls)
+        purl = PURLS["test"]
         tracking_handler.get_download_url(purl, validate=False)
 
         # get_fallback_cmd is called first to check availability, then methods are tried in order
-        assert method_calls == ["fallback_cmd_check", "direct", "api", "fallback_execute"]
+        assert method_calls == [
+            "fallback_cmd_check",
+            "direct",
+            "api",
+            "fallback_execute",
+        ]
 
-    @patch("shutil.which")
-    def test_early_success_skips_later_methods(self, mock_which):
+    def test_early_success_skips_later_methods(self, http_client):
         """Test that successful method skips later methods."""
-        mock_which.return_value = "/usr/bin/testpm"
-        self.http_client.validate_url.return_value = True
+        http_client.validate_url.return_value = True
 
         method_calls = []
-
-        class EarlySuccessHandler(BaseHandler):
-            def build_download_url(self, purl: Purl):
-                method_calls.append("direct")
-                return "https://example.com/direct.tgz"  # Success
-
-            def get_download_url_from_api(self, purl: Purl):
-                method_calls.append("api")
-                return "https://example.com/api.tgz"
-
-            def get_fallback_cmd(self, purl: Purl):
-                method_calls.append("fallback_cmd_check")
-                return "testpm download test"
-
-            def get_package_manager_cmd(self):
-                return ["testpm"]
-
-        handler = EarlySuccessHandler(self.http_client)
-        purl = Purl(ecosystem="test", name="test", version="1.0.0")
+        handler = _EarlySuccessHandler(http_client, method_calls)
+        purl = PURLS["test"]
         result = handler.get_download_url(purl, validate=True)
 
         # get_fallback_cmd is called first to check availability, then direct succeeds
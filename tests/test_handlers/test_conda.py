@@ -1,167 +1,125 @@
 """Tests for Conda handler."""
 
+from dataclasses import replace
+
 import pytest
-from unittest.mock import MagicMock, patch
 
 from purl2src.parser import Purl
 from purl2src.handlers.conda import CondaHandler
 from purl2src.handlers.base import HandlerError
-from purl2src.utils.http import HttpClient
-
 
-class TestCondaHandler:
-    """Test Conda handler functionality."""
+# Shared, immutable inputs; tests derive variants with dataclasses.replace
+NUMPY = Purl(ecosystem="conda", name="numpy", version="1.21.0")
+NUMPY_MAIN = replace(
+    NUMPY, qualifiers={"build": "py39h89e85a6_0", "channel": "main", "subdir": "linux-64"}
+)
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.http_client = MagicMock(spec=HttpClient)
-        self.handler = CondaHandler(self.http_client)
 
-    def test_build_download_url_main_channel(self):
-        """Test building download URL for main channel."""
-        purl = Purl(
-            ecosystem="conda",
-            name="numpy",
-            version="1.21.0",
-            qualifiers={"build": "py39h89e85a6_0", "channel": "main", "subdir": "linux-64"},
-        )
-        url = self.handler.build_download_url(purl)
-        expected = (
-            "https://repo.anaconda.com/pkgs/main/linux-64/numpy-1.21.0-py39h89e85a6_0.tar.bz2"
-        )
-        assert url == expected
+HANDLER_CLS = CondaHandler
 
-    def test_build_download_url_defaults_channel(self):
-        """Test building download URL for defaults channel."""
-        purl = Purl(
-            ecosystem="conda",
-            name="scipy",
-            version="1.7.0",
-            qualifiers={"build": "py39h89e85a6_0", "channel": "defaults", "subdir": "linux-64"},
-        )
-        url = self.handler.build_download_url(purl)
-        expected = "https://repo.anaconda.com/pkgs/main/linux-64/scipy-1.7.0-py39h89e85a6_0.tar.bz2"
-        assert url == expected
 
-    def test_build_download_url_conda_forge(self):
-        """Test building download URL for conda-forge channel."""
-        purl = Purl(
-            ecosystem="conda",
-            name="matplotlib",
-            version="3.4.2",
-            qualifiers={"build": "py39h89e85a6_0", "channel": "conda-forge", "subdir": "linux-64"},
-        )
-        url = self.handler.build_download_url(purl)
-        expected = "https://anaconda.org/conda-forge/matplotlib/3.4.2/download/linux-64/matplotlib-3.4.2-py39h89e85a6_0.tar.bz2"
-        assert url == expected
+class TestCondaHandler:
+    """Test Conda handler functionality."""
 
-    def test_build_download_url_bioconda(self):
-        """Test building download URL for bioconda channel."""
+    @pytest.mark.parametrize(
+        "channel,name,version,build,expected",
+        [
+            (
+                "main",
+                "numpy",
+                "1.21.0",
+                "py39h89e85a6_0",
+                "https://repo.anaconda.com/pkgs/main/linux-64/numpy-1.21.0-py39h89e85a6_0.tar.bz2",
+            ),
+            (
+                "defaults",
+                "scipy",
+                "1.7.0",
+                "py39h89e85a6_0",
+                "https://repo.anaconda.com/pkgs/main/linux-64/scipy-1.7.0-py39h89e85a6_0.tar.bz2",
+            ),
+            (
+                "conda-forge",
+                "matplotlib",
+                "3.4.2",
+                "py39h89e85a6_0",
+                "https://anaconda.org/conda-forge/matplotlib/3.4.2/download/linux-64/"
+                "matplotlib-3.4.2-py39h89e85a6_0.tar.bz2",
+            ),
+            (
+                "bioconda",
+                "samtools",
+                "1.13",
+                "h8c37831_0",
+                "https://anaconda.org/bioconda/samtools/1.13/download/linux-64/"
+                "samtools-1.13-h8c37831_0.tar.bz2",
+            ),
+        ],
+        ids=["main", "defaults", "conda_forge", "bioconda"],
+    )
+    def test_build_download_url(self, handler, channel, name, version, build, expected):
+        """Test building download URLs for main and community channels."""
         purl = Purl(
             ecosystem="conda",
-            name="samtools",
-            version="1.13",
-            qualifiers={"build": "h8c37831_0", "channel": "bioconda", "subdir": "linux-64"},
+            name=name,
+            version=version,
+            qualifiers={"build": build, "channel": channel, "subdir": "linux-64"},
         )
-        url = self.handler.build_download_url(purl)
-        expected = "https://anaconda.org/bioconda/samtools/1.13/download/linux-64/samtools-1.13-h8c37831_0.tar.bz2"
-        assert url == expected
+        assert handler.build_download_url(purl) == expected
 
-    def test_build_download_url_no_version(self):
+    def test_build_download_url_no_version(self, handler):
         """Test building download URL without version."""
-        purl = Purl(
-            ecosystem="conda",
-            name="numpy",
-            qualifiers={"build": "py39h89e85a6_0", "channel": "main", "subdir": "linux-64"},
-        )
-        url = self.handler.build_download_url(purl)
+        purl = replace(NUMPY_MAIN, version=None)
+        url = handler.build_download_url(purl)
         assert url is None
 
-    def test_build_download_url_missing_build(self):
-        """Test error when build qualifier is missing."""
-        purl = Purl(
-            ecosystem="conda",
-            name="numpy",
-            version="1.21.0",
-            qualifiers={"channel": "main", "subdir": "linux-64"},
-        )
-        with pytest.raises(HandlerError, match="Missing required qualifier: build"):
-            self.handler.build_download_url(purl)
+    @pytest.mark.parametrize("missing", ["build", "channel", "subdir"])
+    def test_build_download_url_missing_qualifier(self, handler, missing):
+        """Test error when a required qualifier is missing."""
+        qualifiers = {k: v for k, v in NUMPY_MAIN.qualifiers.items() if k != missing}
+        purl = replace(NUMPY_MAIN, qualifiers=qualifiers)
 
-    def test_build_download_url_missing_channel(self):
-        """Test error when channel qualifier is missing."""
-        purl = Purl(
-            ecosystem="conda",
-            name="numpy",
-            version="1.21.0",
-            qualifiers={"build": "py39h89e85a6_0", "subdir": "linux-64"},
-        )
-        with pytest.raises(HandlerError, match="Missing required qualifier: channel"):
-            self.handler.build_download_url(purl)
-
-    def test_build_download_url_missing_subdir(self):
-        """Test error when subdir qualifier is missing."""
-        purl = Purl(
-            ecosystem="conda",
-            name="numpy",
-            version="1.21.0",
-            qualifiers={"build": "py39h89e85a6_0", "channel": "main"},
-        )
-        with pytest.raises(HandlerError, match="Missing required qualifier: subdir"):
-            self.handler.build_download_url(purl)
+        with pytest.raises(HandlerError) as excinfo:
+            handler.build_download_url(purl)
+        assert str(excinfo.value) == f"Missing required qualifier: {missing}"
 
-    def test_get_download_url_from_api(self):
+    def test_get_download_url_from_api(self, handler):
         """Test that API method returns None (not implemented)."""
-        purl = Purl(ecosystem="conda", name="numpy", version="1.21.0")
-        url = self.handler.get_download_url_from_api(purl)
+        url = handler.get_download_url_from_api(NUMPY)
         assert url is None
 
-    def test_get_fallback_cmd_with_version(self):
+    def test_get_fallback_cmd_with_version(self, handler):
         """Test getting fallback command with version."""
-        purl = Purl(
-            ecosystem="conda", name="numpy", version="1.21.0", qualifiers={"channel": "conda-forge"}
-        )
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = replace(NUMPY, qualifiers={"channel": "conda-forge"})
+        cmd = handler.get_fallback_cmd(purl)
         assert cmd == "conda search -c conda-forge numpy=1.21.0 --info"
 
-    def test_get_fallback_cmd_default_channel(self):
+    def test_get_fallback_cmd_default_channel(self, handler):
         """Test getting fallback command with default channel."""
-        purl = Purl(ecosystem="conda", name="numpy", version="1.21.0")
-        cmd = self.handler.get_fallback_cmd(purl)
+        cmd = handler.get_fallback_cmd(NUMPY)
         assert cmd == "conda search -c conda-forge numpy=1.21.0 --info"
 
-    def test_get_fallback_cmd_no_version(self):
+    def test_get_fallback_cmd_no_version(self, handler):
         """Test getting fallback command without version."""
-        purl = Purl(ecosystem="conda", name="numpy")
-        cmd = self.handler.get_fallback_cmd(purl)
+        cmd = handler.get_fallback_cmd(replace(NUMPY, version=None))
         assert cmd is None
 
-    def test_get_package_manager_cmd(self):
-        """Test getting package manager commands."""
-        cmd = self.handler.get_package_manager_cmd()
-        assert cmd == ["conda", "mamba", "micromamba"]
-
-    def test_is_package_manager_available(self):
-        """Test checking if package manager is available."""
-        with patch("purl2src.handlers.base.shutil.which") as mock_which:
-            # Test conda available
-            mock_which.side_effect = lambda x: "/usr/bin/conda" if x == "conda" else None
-            assert self.handler.is_package_manager_available() is True
-
-            # Test mamba available
-            mock_which.side_effect = lambda x: "/usr/bin/mamba" if x == "mamba" else None
-            assert self.handler.is_package_manager_available() is True
-
-            # Test micromamba available
-            mock_which.side_effect = lambda x: "/usr/bin/micromamba" if x == "micromamba" else None
-            assert self.handler.is_package_manager_available() is True
-
-            # Test none available
-            mock_which.side_effect = None
-            mock_which.return_value = None
-            assert self.handler.is_package_manager_available() is False
-
-    def test_parse_fallback_output_with_url(self):
+    @pytest.mark.parametrize(
+        "paths,expected",
+        [
+            ({"conda": "/usr/bin/conda"}, True),
+            ({"mamba": "/usr/bin/mamba"}, True),
+            ({"micromamba": "/usr/bin/micromamba"}, True),
+            ({}, False),
+        ],
+        ids=["conda", "mamba", "micromamba", "none"],
+    )
+    def test_is_package_manager_available(self, handler, monkeypatch, paths, expected):
+        """Test any of conda, mamba or micromamba counts as available."""
+        monkeypatch.setattr("purl2src.handlers.base.shutil.which", paths.get)
+        assert handler.is_package_manager_available() is expected
+
+    def test_parse_fallback_output_with_url(self, handler):
         """Test parsing conda search output with URL."""
         output = """numpy 1.21.0 py39h89e85a6_0
 file name   : numpy-1.21.0-py39h89e85a6_0.tar.bz2
@@ -178,33 +136,17 @@ dependencies:
   - blas * mkl
   - python >=3.9,<3.10.0a0"""
 
-        url = self.handler.parse_fallback_output(output)
+        url = handler.parse_fallback_output(output)
         assert (
             url
             == "https://repo.anaconda.com/pkgs/main/linux-64/numpy-1.21.0-py39h89e85a6_0.tar.bz2"
         )
 
-    def test_parse_fallback_output_no_url(self):
-        """Test parsing conda search output without URL."""
-        output = """numpy 1.21.0 py39h89e85a6_0
-file name   : numpy-1.21.0-py39h89e85a6_0.tar.bz2
-name        : numpy
-version     : 1.21.0
-build string: py39h89e85a6_0"""
-
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
-
-    def test_parse_fallback_output_empty(self):
-        """Test parsing empty conda search output."""
-        output = ""
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
-
-    def test_parse_fallback_output_invalid_url(self):
-        """Test parsing conda search output with invalid URL."""
+    def test_parse_fallback_output_url_on_next_line(self, handler):
+        """Test the url field and its value must be on the same line."""
         output = """numpy 1.21.0 py39h89e85a6_0
-url         : not-a-valid-url"""
+url         :
+https://repo.anaconda.com/pkgs/main/linux-64/numpy-1.21.0-py39h89e85a6_0.tar.bz2"""
 
-        url = self.handler.parse_fallback_output(output)
+        url = handler.parse_fallback_output(output)
         assert url is None
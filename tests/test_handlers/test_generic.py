@@ -1,300 +1,214 @@
 """Tests for Generic handler."""
 
+from unittest.mock import call
+
 import pytest
-from unittest.mock import MagicMock, patch
 
 from purl2src.parser import Purl
 from purl2src.handlers.generic import GenericHandler
 from purl2src.handlers.base import HandlerResult
-from purl2src.utils.http import HttpClient
+
+from ._fakes import FakeHttpClient
+
+
+def _mypackage(qualifiers=None, version="1.0.0"):
+    """Build the generic ``mypackage`` PURL used throughout these tests."""
+    return Purl("generic", "mypackage", version, qualifiers=qualifiers or {})
+
+
+SHA256_CHECK = call(
+    "https://example.com/package.tar.gz", expected_checksum="abc123def456", algorithm="sha256"
+)
+
+
+@pytest.fixture
+def http_client():
+    """Fake HTTP client for the handler under test."""
+    return FakeHttpClient()
+
+
+@pytest.fixture
+def handler(http_client):
+    """Fresh handler per test; build_download_url records the VCS commit on it."""
+    return GenericHandler(http_client)
 
 
 class TestGenericHandler:
     """Test Generic handler functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.http_client = MagicMock(spec=HttpClient)
-        self.handler = GenericHandler(self.http_client)
-
-    def test_build_download_url_with_download_url_qualifier(self):
+    def test_build_download_url_with_download_url_qualifier(self, handler):
         """Test building download URL from download_url qualifier."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={"download_url": "https://example.com/package.tar.gz"},
-        )
-        url = self.handler.build_download_url(purl)
+        purl = _mypackage({"download_url": "https://example.com/package.tar.gz"})
+        url = handler.build_download_url(purl)
         assert url == "https://example.com/package.tar.gz"
 
-    def test_build_download_url_with_vcs_url_simple(self):
-        """Test building download URL from simple vcs_url qualifier."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={"vcs_url": "https://github.com/user/repo.git"},
-        )
-        url = self.handler.build_download_url(purl)
-        assert url == "https://github.com/user/repo.git"
-
-    def test_build_download_url_with_vcs_url_git_prefix(self):
-        """Test building download URL from vcs_url with git+ prefix."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={"vcs_url": "git+https://github.com/user/repo.git"},
-        )
-        url = self.handler.build_download_url(purl)
+    @pytest.mark.parametrize(
+        "vcs_url,expected_commit",
+        [
+            ("https://github.com/user/repo.git", None),
+            ("git+https://github.com/user/repo.git", None),
+            ("https://github.com/user/repo.git@abc123def456", "abc123def456"),
+            ("git+https://github.com/user/repo.git@abc123def456", "abc123def456"),
+        ],
+        ids=["simple", "git_prefix", "commit", "git_prefix_commit"],
+    )
+    def test_build_download_url_with_vcs_url(self, handler, vcs_url, expected_commit):
+        """Test building download URL from vcs_url; a commit hash is stored for checkout."""
+        purl = _mypackage({"vcs_url": vcs_url})
+        url = handler.build_download_url(purl)
         assert url == "https://github.com/user/repo.git"
+        assert getattr(handler, "_commit", None) == expected_commit
 
-    def test_build_download_url_with_vcs_url_commit(self):
-        """Test building download URL from vcs_url with commit hash."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={"vcs_url": "https://github.com/user/repo.git@abc123def456"},
-        )
-        url = self.handler.build_download_url(purl)
-        assert url == "https://github.com/user/repo.git"
-        # Check that commit is stored
-        assert hasattr(self.handler, "_commit")
-        assert self.handler._commit == "abc123def456"
-
-    def test_build_download_url_with_vcs_url_git_prefix_commit(self):
-        """Test building download URL from vcs_url with git+ prefix and commit hash."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={"vcs_url": "git+https://github.com/user/repo.git@abc123def456"},
-        )
-        url = self.handler.build_download_url(purl)
-        assert url == "https://github.com/user/repo.git"
-        assert hasattr(self.handler, "_commit")
-        assert self.handler._commit == "abc123def456"
-
-    def test_build_download_url_no_qualifiers(self):
+    def test_build_download_url_no_qualifiers(self, handler):
         """Test building download URL without relevant qualifiers."""
-        purl = Purl(ecosystem="generic", name="mypackage", version="1.0.0")
-        url = self.handler.build_download_url(purl)
+        purl = _mypackage()
+        url = handler.build_download_url(purl)
         assert url is None
 
-    def test_build_download_url_priority_download_url_over_vcs(self):
+    def test_build_download_url_priority_download_url_over_vcs(self, handler):
         """Test that download_url takes priority over vcs_url."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={
+        purl = _mypackage(
+            {
                 "download_url": "https://example.com/package.tar.gz",
                 "vcs_url": "https://github.com/user/repo.git",
-            },
+            }
         )
-        url = self.handler.build_download_url(purl)
+        url = handler.build_download_url(purl)
         assert url == "https://example.com/package.tar.gz"
 
-    def test_get_download_url_from_api(self):
+    def test_get_download_url_from_api(self, handler):
         """Test that API method returns None (not implemented)."""
-        purl = Purl(ecosystem="generic", name="mypackage", version="1.0.0")
-        url = self.handler.get_download_url_from_api(purl)
+        purl = _mypackage()
+        url = handler.get_download_url_from_api(purl)
         assert url is None
 
-    def test_get_fallback_cmd_with_vcs_url_simple(self):
-        """Test getting fallback command for simple vcs_url."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            qualifiers={"vcs_url": "https://github.com/user/repo.git"},
-        )
-        cmd = self.handler.get_fallback_cmd(purl)
-        assert cmd == "git clone https://github.com/user/repo.git"
-
-    def test_get_fallback_cmd_with_vcs_url_git_prefix(self):
-        """Test getting fallback command for vcs_url with git+ prefix."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            qualifiers={"vcs_url": "git+https://github.com/user/repo.git"},
-        )
-        cmd = self.handler.get_fallback_cmd(purl)
-        assert cmd == "git clone https://github.com/user/repo.git"
-
-    def test_get_fallback_cmd_with_vcs_url_commit(self):
-        """Test getting fallback command for vcs_url with commit hash."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            qualifiers={"vcs_url": "https://github.com/user/repo.git@abc123def456"},
-        )
-        cmd = self.handler.get_fallback_cmd(purl)
-        assert cmd == "git clone https://github.com/user/repo.git && git checkout abc123def456"
-
-    def test_get_fallback_cmd_with_vcs_url_git_prefix_commit(self):
-        """Test getting fallback command for vcs_url with git+ prefix and commit hash."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            qualifiers={"vcs_url": "git+https://github.com/user/repo.git@abc123def456"},
-        )
-        cmd = self.handler.get_fallback_cmd(purl)
-        assert cmd == "git clone https://github.com/user/repo.git && git checkout abc123def456"
-
-    def test_get_fallback_cmd_no_vcs_url(self):
+    @pytest.mark.parametrize(
+        "vcs_url,expected",
+        [
+            ("https://github.com/user/repo.git", "git clone https://github.com/user/repo.git"),
+            ("git+https://github.com/user/repo.git", "git clone https://github.com/user/repo.git"),
+            (
+                "https://github.com/user/repo.git@abc123def456",
+                "git clone https://github.com/user/repo.git && git checkout abc123def456",
+            ),
+            (
+                "git+https://github.com/user/repo.git@abc123def456",
+                "git clone https://github.com/user/repo.git && git checkout abc123def456",
+            ),
+        ],
+        ids=["simple", "git_prefix", "commit", "git_prefix_commit"],
+    )
+    def test_get_fallback_cmd_with_vcs_url(self, handler, vcs_url, expected):
+        """Test getting the git fallback command for vcs_url variants."""
+        purl = _mypackage({"vcs_url": vcs_url}, version=None)
+        assert handler.get_fallback_cmd(purl) == expected
+
+    def test_get_fallback_cmd_no_vcs_url(self, handler):
         """Test getting fallback command without vcs_url qualifier."""
-        purl = Purl(ecosystem="generic", name="mypackage", version="1.0.0")
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = _mypackage()
+        cmd = handler.get_fallback_cmd(purl)
         assert cmd is None
 
-    def test_get_package_manager_cmd(self):
-        """Test getting package manager command."""
-        cmd = self.handler.get_package_manager_cmd()
-        assert cmd == ["git"]
-
-    def test_is_package_manager_available(self):
+    def test_is_package_manager_available(self, handler, monkeypatch):
         """Test checking if package manager is available."""
-        with patch("shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/git"
-            assert self.handler.is_package_manager_available() is True
-
-            mock_which.return_value = None
-            assert self.handler.is_package_manager_available() is False
-
-    def test_parse_fallback_output(self):
-        """Test parsing git output."""
-        # Git clone doesn't return download URLs
-        output = "Cloning into 'repo'..."
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
+        monkeypatch.setattr("purl2src.handlers.base.shutil.which", lambda _: "/usr/bin/git")
+        assert handler.is_package_manager_available() is True
 
-        # Test empty output
-        output = ""
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
+        monkeypatch.setattr("purl2src.handlers.base.shutil.which", lambda _: None)
+        assert handler.is_package_manager_available() is False
 
-    def test_get_download_url_with_checksum_validation_sha256(self):
+    def test_get_download_url_with_checksum_validation_sha256(self, handler, http_client):
         """Test download URL with SHA256 checksum validation."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={
+        purl = _mypackage(
+            {
                 "download_url": "https://example.com/package.tar.gz",
                 "checksum": "sha256:abc123def456",
-            },
+            }
         )
 
         # Mock validation success
-        self.http_client.validate_url.return_value = True
-        self.http_client.download_and_verify.return_value = None
+        http_client.validate_url.return_value = True
+        http_client.download_and_verify.return_value = None
 
-        result = self.handler.get_download_url(purl, validate=True)
+        result = handler.get_download_url(purl, validate=True)
 
         assert result.download_url == "https://example.com/package.tar.gz"
         assert result.status == "success"
         assert result.validated is True
 
         # Verify checksum validation was called
-        self.http_client.download_and_verify.assert_called_once_with(
-            "https://example.com/package.tar.gz",
-            expected_checksum="abc123def456",
-            algorithm="sha256",
-        )
+        assert http_client.download_and_verify.call_args_list == [SHA256_CHECK]
 
-    def test_get_download_url_with_checksum_validation_default_sha256(self):
+    def test_get_download_url_with_checksum_validation_default_sha256(self, handler, http_client):
         """Test download URL with checksum validation (default SHA256)."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={
-                "download_url": "https://example.com/package.tar.gz",
-                "checksum": "abc123def456",
-            },
+        purl = _mypackage(
+            {"download_url": "https://example.com/package.tar.gz", "checksum": "abc123def456"}
         )
 
         # Mock validation success
-        self.http_client.validate_url.return_value = True
-        self.http_client.download_and_verify.return_value = None
+        http_client.validate_url.return_value = True
+        http_client.download_and_verify.return_value = None
 
-        result = self.handler.get_download_url(purl, validate=True)
+        result = handler.get_download_url(purl, validate=True)
 
         assert result.download_url == "https://example.com/package.tar.gz"
         assert result.status == "success"
         assert result.validated is True
 
         # Verify checksum validation was called with default SHA256
-        self.http_client.download_and_verify.assert_called_once_with(
-            "https://example.com/package.tar.gz",
-            expected_checksum="abc123def456",
-            algorithm="sha256",
-        )
+        assert http_client.download_and_verify.call_args_list == [SHA256_CHECK]
 
-    def test_get_download_url_with_checksum_validation_failure(self):
+    def test_get_download_url_with_checksum_validation_failure(self, handler, http_client):
         """Test download URL with checksum validation failure."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={
+        purl = _mypackage(
+            {
                 "download_url": "https://example.com/package.tar.gz",
                 "checksum": "sha256:abc123def456",
-            },
+            }
         )
 
         # Mock validation success but checksum failure
-        self.http_client.validate_url.return_value = True
-        self.http_client.download_and_verify.side_effect = ValueError("Checksum mismatch")
+        http_client.validate_url.return_value = True
+        http_client.download_and_verify.side_effect = ValueError("Checksum mismatch")
 
-        result = self.handler.get_download_url(purl, validate=True)
+        result = handler.get_download_url(purl, validate=True)
 
         assert result.download_url == "https://example.com/package.tar.gz"
         assert result.status == "failed"
         assert result.validated is False
         assert result.error == "Checksum mismatch"
 
-    def test_get_download_url_without_checksum(self):
+    def test_get_download_url_without_checksum(self, handler, http_client):
         """Test download URL without checksum validation."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={"download_url": "https://example.com/package.tar.gz"},
-        )
+        purl = _mypackage({"download_url": "https://example.com/package.tar.gz"})
 
         # Mock validation success
-        self.http_client.validate_url.return_value = True
+        http_client.validate_url.return_value = True
 
-        result = self.handler.get_download_url(purl, validate=True)
+        result = handler.get_download_url(purl, validate=True)
 
         assert result.download_url == "https://example.com/package.tar.gz"
         assert result.status == "success"
         assert result.validated is True
 
         # Verify checksum validation was not called
-        self.http_client.download_and_verify.assert_not_called()
+        http_client.download_and_verify.assert_not_called()
 
-    def test_get_download_url_without_validation(self):
+    def test_get_download_url_without_validation(self, handler, http_client):
         """Test download URL without URL validation."""
-        purl = Purl(
-            ecosystem="generic",
-            name="mypackage",
-            version="1.0.0",
-            qualifiers={
+        purl = _mypackage(
+            {
                 "download_url": "https://example.com/package.tar.gz",
                 "checksum": "sha256:abc123def456",
-            },
+            }
         )
 
-        result = self.handler.get_download_url(purl, validate=False)
+        result = handler.get_download_url(purl, validate=False)
 
         assert result.download_url == "https://example.com/package.tar.gz"
         assert result.status == "success"
         assert result.validated is False
 
         # Verify neither URL nor checksum validation was called
-        self.http_client.validate_url.assert_not_called()
-        self.http_client.download_and_verify.assert_not_called()
+        http_client.validate_url.assert_not_called()
+        http_client.download_and_verify.assert_not_called()
@@ -1,203 +1,158 @@
 """Tests for GitHub handler."""
 
 import pytest
-from unittest.mock import MagicMock, patch
 
 from purl2src.parser import Purl
 from purl2src.handlers.github import GitHubHandler
-from purl2src.utils.http import HttpClient
+
+
+def _github(namespace, name, version=None, subpath=None):
+    """Build a GitHub PURL from positional fields."""
+    return Purl("github", name, version, namespace, subpath=subpath)
+
+
+HANDLER_CLS = GitHubHandler
 
 
 class TestGitHubHandler:
     """Test GitHub handler functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.http_client = MagicMock(spec=HttpClient)
-        self.handler = GitHubHandler(self.http_client)
-
-    def test_build_download_url_simple_repo(self):
+    def test_build_download_url_simple_repo(self, handler):
         """Test building download URL for simple repository."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", version="v7.0.0")
-        url = self.handler.build_download_url(purl)
+        purl = _github("rails", "rails", "v7.0.0")
+        url = handler.build_download_url(purl)
         assert url == "https://github.com/rails/rails.git"
 
-    def test_build_download_url_no_namespace(self):
+    def test_build_download_url_no_namespace(self, handler):
         """Test building download URL without namespace returns None."""
-        purl = Purl(ecosystem="github", name="rails")
-        url = self.handler.build_download_url(purl)
+        purl = _github(None, "rails")
+        url = handler.build_download_url(purl)
         assert url is None
 
-    def test_build_download_url_with_subpath(self):
+    def test_build_download_url_with_subpath(self, handler):
         """Test building download URL with subpath."""
-        purl = Purl(
-            ecosystem="github",
-            namespace="rails",
-            name="rails",
-            version="v7.0.0",
-            subpath="README.md",
-        )
-        url = self.handler.build_download_url(purl)
+        purl = _github("rails", "rails", "v7.0.0", "README.md")
+        url = handler.build_download_url(purl)
         assert url == "https://raw.githubusercontent.com/rails/rails/v7.0.0/README.md"
 
-    def test_build_download_url_with_subpath_no_version(self):
+    def test_build_download_url_with_subpath_no_version(self, handler):
         """Test building download URL with subpath but no version uses main."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", subpath="lib/rails.rb")
-        url = self.handler.build_download_url(purl)
+        purl = _github("rails", "rails", None, "lib/rails.rb")
+        url = handler.build_download_url(purl)
         assert url == "https://raw.githubusercontent.com/rails/rails/main/lib/rails.rb"
 
-    def test_build_download_url_with_subpath_deep_path(self):
+    def test_build_download_url_with_subpath_deep_path(self, handler):
         """Test building download URL with deep subpath."""
-        purl = Purl(
-            ecosystem="github",
-            namespace="rails",
-            name="rails",
-            version="v7.0.0",
-            subpath="activerecord/lib/active_record.rb",
-        )
-        url = self.handler.build_download_url(purl)
+        purl = _github("rails", "rails", "v7.0.0", "activerecord/lib/active_record.rb")
+        url = handler.build_download_url(purl)
         assert (
             url
             == "https://raw.githubusercontent.com/rails/rails/v7.0.0/activerecord/lib/active_record.rb"
         )
 
-    def test_get_download_url_from_api_no_namespace(self):
+    def test_get_download_url_from_api_no_namespace(self, handler):
         """Test API method without namespace returns None."""
-        purl = Purl(ecosystem="github", name="rails")
-        url = self.handler.get_download_url_from_api(purl)
+        purl = _github(None, "rails")
+        url = handler.get_download_url_from_api(purl)
         assert url is None
 
-    def test_get_download_url_from_api_release_success(self):
-        """Test API method for release version."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", version="v7.0.0")
-
-        # Mock successful API response
-        self.http_client.get_json.return_value = {
-            "tarball_url": "https://api.github.com/repos/rails/rails/tarball/v7.0.0"
-        }
-
-        url = self.handler.get_download_url_from_api(purl)
-        assert url == "https://api.github.com/repos/rails/rails/tarball/v7.0.0"
-
-        # Verify API call
-        self.http_client.get_json.assert_called_once_with(
-            "https://api.github.com/repos/rails/rails/releases/tags/v7.0.0"
-        )
-
-    def test_get_download_url_from_api_release_failure(self):
-        """Test API method for release version with API failure."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", version="v7.0.0")
-
-        # Mock API failure
-        self.http_client.get_json.side_effect = Exception("API Error")
-
-        url = self.handler.get_download_url_from_api(purl)
-        # Should fallback to archive URL
-        assert url == "https://github.com/rails/rails/archive/refs/tags/v7.0.0.tar.gz"
-
-    def test_get_download_url_from_api_branch_main(self):
-        """Test API method for main branch."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", version="main")
-
-        url = self.handler.get_download_url_from_api(purl)
-        # Should not try releases API for main/master
-        assert url == "https://github.com/rails/rails/archive/refs/tags/main.tar.gz"
-
-        # Verify no API call was made
-        self.http_client.get_json.assert_not_called()
-
-    def test_get_download_url_from_api_branch_master(self):
-        """Test API method for master branch."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", version="master")
-
-        url = self.handler.get_download_url_from_api(purl)
-        # Should not try releases API for main/master
-        assert url == "https://github.com/rails/rails/archive/refs/tags/master.tar.gz"
-
-        # Verify no API call was made
-        self.http_client.get_json.assert_not_called()
-
-    def test_get_download_url_from_api_no_version(self):
-        """Test API method without version."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails")
-
-        url = self.handler.get_download_url_from_api(purl)
-        assert url is None
-
-    def test_get_fallback_cmd_with_version(self):
+    @pytest.mark.parametrize(
+        "version,response,error,expected",
+        [
+            (
+                "v7.0.0",
+                {"tarball_url": "https://api.github.com/repos/rails/rails/tarball/v7.0.0"},
+                None,
+                "https://api.github.com/repos/rails/rails/tarball/v7.0.0",
+            ),
+            (
+                "v7.0.0",
+                None,
+                Exception("API Error"),
+                "https://github.com/rails/rails/archive/refs/tags/v7.0.0.tar.gz",
+            ),
+            (
+                "v7.0.0",
+                {"name": "v7.0.0", "tag_name": "v7.0.0"},
+                None,
+                "https://github.com/rails/rails/archive/refs/tags/v7.0.0.tar.gz",
+            ),
+            ("main", None, None, "https://github.com/rails/rails/archive/refs/tags/main.tar.gz"),
+            (
+                "master",
+                None,
+                None,
+                "https://github.com/rails/rails/archive/refs/tags/master.tar.gz",
+            ),
+            (None, None, None, None),
+        ],
+        ids=[
+            "release_success",
+            "release_failure",
+            "release_no_tarball",
+            "branch_main",
+            "branch_master",
+            "no_version",
+        ],
+    )
+    def test_get_download_url_from_api(
+        self, handler, http_client, version, response, error, expected
+    ):
+        """Test the releases API is tried for tags and falls back to the archive URL."""
+        purl = _github("rails", "rails", version)
+        http_client.get_json.return_value = response
+        http_client.get_json.side_effect = error
+
+        assert handler.get_download_url_from_api(purl) == expected
+
+        # Releases API is only queried for tags, never for main/master or unversioned PURLs
+        if version in (None, "main", "master"):
+            http_client.get_json.assert_not_called()
+        else:
+            http_client.get_json.assert_called_once_with(
+                f"https://api.github.com/repos/rails/rails/releases/tags/{version}"
+            )
+
+    def test_get_fallback_cmd_with_version(self, handler):
         """Test getting fallback command with version."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", version="v7.0.0")
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = _github("rails", "rails", "v7.0.0")
+        cmd = handler.get_fallback_cmd(purl)
         assert (
             cmd == "git clone https://github.com/rails/rails.git && cd rails && git checkout v7.0.0"
         )
 
-    def test_get_fallback_cmd_no_version(self):
+    def test_get_fallback_cmd_no_version(self, handler):
         """Test getting fallback command without version."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails")
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = _github("rails", "rails")
+        cmd = handler.get_fallback_cmd(purl)
         assert cmd == "git clone https://github.com/rails/rails.git"
 
-    def test_get_fallback_cmd_no_namespace(self):
+    def test_get_fallback_cmd_no_namespace(self, handler):
         """Test getting fallback command without namespace."""
-        purl = Purl(ecosystem="github", name="rails")
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = _github(None, "rails")
+        cmd = handler.get_fallback_cmd(purl)
         assert cmd is None
 
-    def test_get_fallback_cmd_complex_names(self):
+    def test_get_fallback_cmd_complex_names(self, handler):
         """Test getting fallback command with complex names."""
-        purl = Purl(
-            ecosystem="github",
-            namespace="microsoft",
-            name="vscode-python",
-            version="2021.8.1105767423",
-        )
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = _github("microsoft", "vscode-python", "2021.8.1105767423")
+        cmd = handler.get_fallback_cmd(purl)
         assert (
             cmd
             == "git clone https://github.com/microsoft/vscode-python.git && cd vscode-python && git checkout 2021.8.1105767423"
         )
 
-    def test_get_package_manager_cmd(self):
-        """Test getting package manager command."""
-        cmd = self.handler.get_package_manager_cmd()
-        assert cmd == ["git"]
-
-    def test_is_package_manager_available(self):
+    def test_is_package_manager_available(self, handler, monkeypatch):
         """Test checking if package manager is available."""
-        with patch("shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/git"
-            assert self.handler.is_package_manager_available() is True
-
-            mock_which.return_value = None
-            assert self.handler.is_package_manager_available() is False
-
-    def test_parse_fallback_output(self):
-        """Test parsing git output."""
-        # Git clone doesn't return download URLs
-        output = "Cloning into 'rails'..."
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
-
-        # Test empty output
-        output = ""
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
-
-    def test_get_download_url_from_api_release_no_tarball(self):
-        """Test API method for release without tarball_url."""
-        purl = Purl(ecosystem="github", namespace="rails", name="rails", version="v7.0.0")
-
-        # Mock API response without tarball_url
-        self.http_client.get_json.return_value = {"name": "v7.0.0", "tag_name": "v7.0.0"}
+        monkeypatch.setattr("purl2src.handlers.base.shutil.which", lambda _: "/usr/bin/git")
+        assert handler.is_package_manager_available() is True
 
-        url = self.handler.get_download_url_from_api(purl)
-        # Should fallback to archive URL
-        assert url == "https://github.com/rails/rails/archive/refs/tags/v7.0.0.tar.gz"
+        monkeypatch.setattr("purl2src.handlers.base.shutil.which", lambda _: None)
+        assert handler.is_package_manager_available() is False
 
-    def test_archive_url_format(self):
+    def test_archive_url_format(self, handler):
         """Test that archive URL format is correct."""
-        purl = Purl(ecosystem="github", namespace="user", name="repo", version="v1.0.0")
+        purl = _github("user", "repo", "v1.0.0")
 
-        url = self.handler.get_download_url_from_api(purl)
+        url = handler.get_download_url_from_api(purl)
         assert url == "https://github.com/user/repo/archive/refs/tags/v1.0.0.tar.gz"
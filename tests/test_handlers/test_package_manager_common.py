@@ -0,0 +1,53 @@
+"""Package manager checks shared across handlers."""
+
+import pytest
+
+from purl2src.handlers.cargo import CargoHandler
+from purl2src.handlers.conda import CondaHandler
+from purl2src.handlers.generic import GenericHandler
+from purl2src.handlers.github import GitHubHandler
+from purl2src.handlers.golang import GoLangHandler
+from purl2src.handlers.maven import MavenHandler
+from purl2src.handlers.npm import NpmHandler
+from purl2src.handlers.nuget import NuGetHandler
+from purl2src.handlers.pypi import PyPiHandler
+from purl2src.handlers.rubygems import RubyGemsHandler
+
+from ._fakes import FakeHttpClient
+
+# Commands each handler probes, in preference order
+PACKAGE_MANAGER_CMDS = [
+    (CargoHandler, ["cargo"]),
+    (CondaHandler, ["conda", "mamba", "micromamba"]),
+    (GenericHandler, ["git"]),
+    (GitHubHandler, ["git"]),
+    (GoLangHandler, ["go"]),
+    (MavenHandler, ["mvn"]),
+    (NpmHandler, ["npm", "yarn"]),
+    (NuGetHandler, ["nuget", "dotnet"]),
+    (PyPiHandler, ["pip", "pip3"]),
+    (RubyGemsHandler, ["gem"]),
+]
+
+
+@pytest.mark.parametrize(
+    "handler_cls,expected",
+    PACKAGE_MANAGER_CMDS,
+    ids=["cargo", "conda", "generic", "github", "golang", "maven", "npm", "nuget", "pypi", "gem"],
+)
+def test_get_package_manager_cmd(handler_cls, expected):
+    """Test each handler reports its package manager commands."""
+    assert handler_cls(FakeHttpClient()).get_package_manager_cmd() == expected
+
+
+@pytest.mark.parametrize("installed", [True, False], ids=["installed", "missing"])
+@pytest.mark.parametrize(
+    "handler_cls,command",
+    [(CargoHandler, "cargo"), (GoLangHandler, "go"), (MavenHandler, "mvn"), (NpmHandler, "npm")],
+    ids=["cargo", "golang", "maven", "npm"],
+)
+def test_is_package_manager_available(monkeypatch, handler_cls, command, installed):
+    """Test the handler is available exactly when its command is on PATH."""
+    paths = {command: f"/usr/bin/{command}"} if installed else {}
+    monkeypatch.setattr("purl2src.handlers.base.shutil.which", paths.get)
+    assert handler_cls(FakeHttpClient()).is_package_manager_available() is installed
@@ -0,0 +1,53 @@
+"""Fallback output cases shared by handlers whose commands may print no URL."""
+
+import pytest
+
+from purl2src.handlers.conda import CondaHandler
+from purl2src.handlers.generic import GenericHandler
+from purl2src.handlers.github import GitHubHandler
+from purl2src.handlers.nuget import NuGetHandler
+
+from ._fakes import FakeHttpClient
+
+CONDA_NO_URL = """numpy 1.21.0 py39h89e85a6_0
+file name   : numpy-1.21.0-py39h89e85a6_0.tar.bz2
+name        : numpy
+version     : 1.21.0
+build string: py39h89e85a6_0"""
+
+# `dotnet nuget list source` lists feeds, not package URLs
+NUGET_SOURCES = """Registered Sources:
+  1.  nuget.org [Enabled]
+      https://api.nuget.org/v3/index.json
+  2.  Microsoft Visual Studio Offline Packages [Enabled]
+      C:\\Program Files (x86)\\Microsoft SDKs\\NuGetPackages\\"""
+
+
+@pytest.mark.parametrize(
+    "handler_cls,output",
+    [
+        pytest.param(CondaHandler, "", id="conda_empty"),
+        pytest.param(CondaHandler, CONDA_NO_URL, id="conda_no_url"),
+        pytest.param(
+            CondaHandler,
+            "numpy 1.21.0 py39h89e85a6_0\nurl         : not-a-valid-url",
+            id="conda_invalid_url",
+        ),
+        # Git clone doesn't return download URLs
+        pytest.param(GenericHandler, "", id="generic_empty"),
+        pytest.param(GenericHandler, "Cloning into 'repo'...", id="generic_git_clone"),
+        pytest.param(GitHubHandler, "", id="github_empty"),
+        pytest.param(GitHubHandler, "Cloning into 'rails'...", id="github_git_clone"),
+        pytest.param(NuGetHandler, "", id="nuget_empty"),
+        pytest.param(NuGetHandler, NUGET_SOURCES, id="nuget_list_source"),
+        pytest.param(
+            NuGetHandler,
+            "error: Unable to load the service index for source https://invalid-source.org/",
+            id="nuget_error",
+        ),
+    ],
+)
+def test_parse_fallback_output_without_url(handler_cls, output):
+    """Test fallback output without a usable URL yields None."""
+    handler = handler_cls(FakeHttpClient())
+    assert handler.parse_fallback_output(output) is None
@@ -1,295 +1,275 @@
 """Tests for PyPI handler."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import call
 
 from purl2src.parser import Purl
 from purl2src.handlers.pypi import PyPiHandler
-from purl2src.utils.http import HttpClient
+
+PYPI_SOURCE = "https://pypi.python.org/packages/source"
+
+
+def _sdist(name, version, letter=None):
+    """Expected sdist URL; the index letter defaults to the name's first character."""
+    return f"{PYPI_SOURCE}/{letter or name[0]}/{name}/{name}-{version}.tar.gz"
+
+
+# Shared, immutable PURLs keyed by name[@version]
+PYPI_PURLS = {
+    "requests@2.28.1": Purl(ecosystem="pypi", name="requests", version="2.28.1"),
+    "Zope.Interface@5.4.0": Purl(ecosystem="pypi", name="Zope.Interface", version="5.4.0"),
+    "requests": Purl(ecosystem="pypi", name="requests"),
+    "requests@99.99.99": Purl(ecosystem="pypi", name="requests", version="99.99.99"),
+    "my-package@1.0.0": Purl(ecosystem="pypi", name="my-package", version="1.0.0"),
+}
+
+REQUESTS_SDIST_URL = (
+    "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz"
+)
+REQUESTS_WHEEL_URL = "https://files.pythonhosted.org/packages/py3/requests-2.28.1-py3-none-any.whl"
+
+# API payloads shared between tests; the handler only reads them
+_REQUESTS_SDIST = {"packagetype": "sdist", "url": REQUESTS_SDIST_URL}
+_REQUESTS_WHEEL = {"packagetype": "bdist_wheel", "url": REQUESTS_WHEEL_URL}
+REQUESTS_RELEASES = {"releases": {"2.28.1": [_REQUESTS_SDIST, _REQUESTS_WHEEL]}}
+REQUESTS_RELEASES_NO_SDIST = {
+    "releases": {
+        "2.28.1": [_REQUESTS_WHEEL, {"packagetype": "other", "url": REQUESTS_SDIST_URL}],
+    }
+}
+REQUESTS_LATEST = {"urls": [_REQUESTS_SDIST, _REQUESTS_WHEEL]}
+ZOPE_SIMPLE_INDEX = {
+    "files": [
+        {
+            "filename": "zope.interface-5.4.0-cp39-cp39-manylinux1_x86_64.whl",
+            "url": "https://files.pythonhosted.org/packages/zope.interface-5.4.0.whl",
+        },
+        {
+            "filename": "zope.interface-5.4.0.1.tar.gz",
+            "url": "https://files.pythonhosted.org/packages/zope.interface-5.4.0.1.tar.gz",
+        },
+        {
+            "filename": "zope.interface-5.4.0.tar.gz",
+            "url": "https://files.pythonhosted.org/packages/zope.interface-5.4.0.tar.gz",
+        },
+    ]
+}
+
+# `pip download` output samples for parse_fallback_output
+PIP_DOWNLOADING = (
+    "Collecting requests==2.28.1\n"
+    f"  Downloading {REQUESTS_SDIST_URL} (109kB)\n"
+    "Successfully downloaded requests"
+)
+PIP_FROM = (
+    "Collecting requests==2.28.1\n"
+    f"  Using cached requests-2.28.1.tar.gz from {REQUESTS_SDIST_URL}\n"
+    "Successfully downloaded requests"
+)
+PIP_NO_URL = (
+    "Collecting requests==2.28.1\n"
+    "  Using cached requests-2.28.1.tar.gz\n"
+    "Successfully downloaded requests"
+)
+PIP_MULTI = (
+    "Collecting requests==2.28.1\n"
+    f"  Downloading {REQUESTS_SDIST_URL} (109kB)\n"
+    "Collecting urllib3>=1.21.1\n"
+    "  Downloading https://files.pythonhosted.org/packages/source/u/urllib3/"
+    "urllib3-1.26.12.tar.gz (300kB)\n"
+    "Successfully downloaded requests urllib3"
+)
+
+HANDLER_CLS = PyPiHandler
 
 
 class TestPyPiHandler:
     """Test PyPI handler functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.http_client = MagicMock(spec=HttpClient)
-        self.handler = PyPiHandler(self.http_client)
-
-    def test_build_download_url_basic(self):
-        """Test building download URL for basic package."""
-        purl = Purl(ecosystem="pypi", name="requests", version="2.28.1")
-        url = self.handler.build_download_url(purl)
-        expected = "https://pypi.python.org/packages/source/r/requests/requests-2.28.1.tar.gz"
-        assert url == expected
-
-    def test_build_download_url_with_namespace(self):
-        """Test building download URL with namespace (uses namespace for first letter)."""
-        purl = Purl(ecosystem="pypi", namespace="mycompany", name="package", version="1.0.0")
-        url = self.handler.build_download_url(purl)
-        expected = "https://pypi.python.org/packages/source/m/package/package-1.0.0.tar.gz"
-        assert url == expected
-
-    def test_build_download_url_no_version(self):
-        """Test building download URL without version returns None."""
-        purl = Purl(ecosystem="pypi", name="requests")
-        url = self.handler.build_download_url(purl)
-        assert url is None
-
-    def test_build_download_url_first_letter_extraction(self):
-        """Test first letter extraction for different package names."""
-        # Test uppercase
-        purl = Purl(ecosystem="pypi", name="Django", version="4.1.0")
-        url = self.handler.build_download_url(purl)
-        expected = "https://pypi.python.org/packages/source/d/Django/Django-4.1.0.tar.gz"
-        assert url == expected
-
-        # Test number
-        purl = Purl(ecosystem="pypi", name="3to2", version="1.1.1")
-        url = self.handler.build_download_url(purl)
-        expected = "https://pypi.python.org/packages/source/3/3to2/3to2-1.1.1.tar.gz"
-        assert url == expected
-
-        # Test special character
-        purl = Purl(ecosystem="pypi", name="-package", version="1.0.0")
-        url = self.handler.build_download_url(purl)
-        expected = "https://pypi.python.org/packages/source/-/-package/-package-1.0.0.tar.gz"
-        assert url == expected
-
-    def test_get_download_url_from_api_with_version(self):
+    @pytest.mark.parametrize(
+        "namespace,name,version,expected",
+        [
+            (None, "requests", "2.28.1", _sdist("requests", "2.28.1")),
+            ("mycompany", "package", "1.0.0", _sdist("package", "1.0.0", letter="m")),
+            (None, "requests", None, None),
+            (None, "Django", "4.1.0", _sdist("Django", "4.1.0", letter="d")),
+            (None, "3to2", "1.1.1", _sdist("3to2", "1.1.1")),
+            (None, "-package", "1.0.0", _sdist("-package", "1.0.0")),
+            (None, "my_package", "1.0.0", _sdist("my_package", "1.0.0")),
+            (None, "my.package", "1.0.0", _sdist("my.package", "1.0.0")),
+        ],
+        ids=[
+            "basic",
+            "with_namespace",
+            "no_version",
+            "uppercase_first_letter",
+            "numeric_first_letter",
+            "special_first_letter",
+            "underscore_in_name",
+            "dot_in_name",
+        ],
+    )
+    def test_build_download_url(self, handler, namespace, name, version, expected):
+        """Test building sdist URLs; the first letter comes from the namespace if set."""
+        purl = Purl(ecosystem="pypi", namespace=namespace, name=name, version=version)
+        assert handler.build_download_url(purl) == expected
+
+    def test_get_download_url_from_api_with_version(self, handler, http_client):
         """Test API method with specific version."""
-        purl = Purl(ecosystem="pypi", name="requests", version="2.28.1")
+        purl = PYPI_PURLS["requests@2.28.1"]
 
         # Mock API response
-        self.http_client.get_json.return_value = {
-            "releases": {
-                "2.28.1": [
-                    {
-                        "packagetype": "sdist",
-                        "url": "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz",
-                    },
-                    {
-                        "packagetype": "bdist_wheel",
-                        "url": "https://files.pythonhosted.org/packages/py3/requests-2.28.1-py3-none-any.whl",
-                    },
-                ]
-            }
-        }
-
-        url = self.handler.get_download_url_from_api(purl)
-        assert (
-            url
-            == "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz"
-        )
+        http_client.get_json.return_value = REQUESTS_RELEASES
+
+        url = handler.get_download_url_from_api(purl)
+        assert url == REQUESTS_SDIST_URL
+
+        # Simple index has no sdist for this version, so the JSON API is queried
+        assert http_client.get_json.call_args_list == [
+            call(
+                "https://pypi.org/simple/requests/",
+                headers={"Accept": "application/vnd.pypi.simple.v1+json"},
+            ),
+            call("https://pypi.org/pypi/requests/json"),
+        ]
+
+    def test_get_download_url_from_simple_index(self, handler, http_client):
+        """Test API method uses the simple index when it lists the sdist."""
+        purl = PYPI_PURLS["Zope.Interface@5.4.0"]
 
-        # Verify API call
-        self.http_client.get_json.assert_called_once_with("https://pypi.org/pypi/requests/json")
+        http_client.get_json.return_value = ZOPE_SIMPLE_INDEX
 
-    def test_get_download_url_from_api_latest_version(self):
+        url = handler.get_download_url_from_api(purl)
+        assert url == "https://files.pythonhosted.org/packages/zope.interface-5.4.0.tar.gz"
+
+        http_client.get_json.assert_called_once_with(
+            "https://pypi.org/simple/zope-interface/",
+            headers={"Accept": "application/vnd.pypi.simple.v1+json"},
+        )
+
+    def test_get_download_url_from_simple_index_error_falls_back(self, handler, http_client):
+        """Test API method falls back to the JSON API when the simple index fails."""
+        purl = PYPI_PURLS["requests@2.28.1"]
+
+        http_client.get_json.side_effect = [
+            Exception("Not Acceptable"),
+            {
+                "releases": {
+                    "2.28.1": [
+                        {
+                            "packagetype": "sdist",
+                            "url": "https://files.pythonhosted.org/requests-2.28.1.tar.gz",
+                        }
+                    ]
+                }
+            },
+        ]
+
+        url = handler.get_download_url_from_api(purl)
+        assert url == "https://files.pythonhosted.org/requests-2.28.1.tar.gz"
+
+    def test_get_download_url_from_api_latest_version(self, handler, http_client):
         """Test API method without version (latest)."""
-        purl = Purl(ecosystem="pypi", name="requests")
+        purl = PYPI_PURLS["requests"]
 
         # Mock API response
-        self.http_client.get_json.return_value = {
-            "urls": [
-                {
-                    "packagetype": "sdist",
-                    "url": "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz",
-                },
-                {
-                    "packagetype": "bdist_wheel",
-                    "url": "https://files.pythonhosted.org/packages/py3/requests-2.28.1-py3-none-any.whl",
-                },
-            ]
-        }
-
-        url = self.handler.get_download_url_from_api(purl)
-        assert (
-            url
-            == "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz"
-        )
+        http_client.get_json.return_value = REQUESTS_LATEST
 
-    def test_get_download_url_from_api_no_sdist(self):
+        url = handler.get_download_url_from_api(purl)
+        assert url == REQUESTS_SDIST_URL
+
+    def test_get_download_url_from_api_no_sdist(self, handler, http_client):
         """Test API method when no sdist available, fallback to any tar.gz."""
-        purl = Purl(ecosystem="pypi", name="requests", version="2.28.1")
+        purl = PYPI_PURLS["requests@2.28.1"]
 
         # Mock API response with only wheel
-        self.http_client.get_json.return_value = {
-            "releases": {
-                "2.28.1": [
-                    {
-                        "packagetype": "bdist_wheel",
-                        "url": "https://files.pythonhosted.org/packages/py3/requests-2.28.1-py3-none-any.whl",
-                    },
-                    {
-                        "packagetype": "other",
-                        "url": "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz",
-                    },
-                ]
-            }
-        }
-
-        url = self.handler.get_download_url_from_api(purl)
-        assert (
-            url
-            == "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz"
-        )
+        http_client.get_json.return_value = REQUESTS_RELEASES_NO_SDIST
+
+        url = handler.get_download_url_from_api(purl)
+        assert url == REQUESTS_SDIST_URL
 
-    def test_get_download_url_from_api_version_not_found(self):
+    def test_get_download_url_from_api_version_not_found(self, handler, http_client):
         """Test API method when version is not found."""
-        purl = Purl(ecosystem="pypi", name="requests", version="99.99.99")
+        purl = PYPI_PURLS["requests@99.99.99"]
 
         # Mock API response without the requested version
-        self.http_client.get_json.return_value = {
-            "releases": {
-                "2.28.1": [
-                    {
-                        "packagetype": "sdist",
-                        "url": "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz",
-                    }
-                ]
-            }
-        }
-
-        url = self.handler.get_download_url_from_api(purl)
+        http_client.get_json.return_value = REQUESTS_RELEASES
+
+        url = handler.get_download_url_from_api(purl)
         assert url is None
 
-    def test_get_download_url_from_api_exception(self):
+    def test_get_download_url_from_api_exception(self, handler, http_client):
         """Test API method with exception."""
-        purl = Purl(ecosystem="pypi", name="requests", version="2.28.1")
+        purl = PYPI_PURLS["requests@2.28.1"]
 
         # Mock API exception
-        self.http_client.get_json.side_effect = Exception("API Error")
+        http_client.get_json.side_effect = Exception("API Error")
 
-        url = self.handler.get_download_url_from_api(purl)
+        url = handler.get_download_url_from_api(purl)
         assert url is None
 
-    def test_get_fallback_cmd_with_version(self):
+    def test_get_fallback_cmd_with_version(self, handler):
         """Test getting fallback command with version."""
-        purl = Purl(ecosystem="pypi", name="requests", version="2.28.1")
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = PYPI_PURLS["requests@2.28.1"]
+        cmd = handler.get_fallback_cmd(purl)
         assert cmd == "pip download --no-deps --no-binary :all: requests%3D%3D2.28.1"
 
-    def test_get_fallback_cmd_no_version(self):
+    def test_get_fallback_cmd_no_version(self, handler):
         """Test getting fallback command without version."""
-        purl = Purl(ecosystem="pypi", name="requests")
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = PYPI_PURLS["requests"]
+        cmd = handler.get_fallback_cmd(purl)
         assert cmd is None
 
-    def test_get_fallback_cmd_special_characters(self):
+    def test_get_fallback_cmd_special_characters(self, handler):
         """Test getting fallback command with special characters."""
-        purl = Purl(ecosystem="pypi", name="my-package", version="1.0.0")
-        cmd = self.handler.get_fallback_cmd(purl)
+        purl = PYPI_PURLS["my-package@1.0.0"]
+        cmd = handler.get_fallback_cmd(purl)
         assert cmd == "pip download --no-deps --no-binary :all: my-package%3D%3D1.0.0"
 
-    def test_get_package_manager_cmd(self):
-        """Test getting package manager commands."""
-        cmd = self.handler.get_package_manager_cmd()
-        assert cmd == ["pip", "pip3"]
-
-    def test_is_package_manager_available_pip(self):
-        """Test checking if pip is available."""
-        with patch("shutil.which") as mock_which:
-            # Test pip available
-            mock_which.side_effect = lambda x: "/usr/bin/pip" if x == "pip" else None
-            assert self.handler.is_package_manager_available() is True
-
-    def test_is_package_manager_available_pip3(self):
-        """Test checking if pip3 is available."""
-        with patch("shutil.which") as mock_which:
-            # Test pip3 available
-            mock_which.side_effect = lambda x: "/usr/bin/pip3" if x == "pip3" else None
-            assert self.handler.is_package_manager_available() is True
-
-    def test_is_package_manager_available_none(self):
-        """Test checking if no package manager is available."""
-        with patch("shutil.which") as mock_which:
-            mock_which.return_value = None
-            assert self.handler.is_package_manager_available() is False
-
-    def test_parse_fallback_output_downloading_pattern(self):
-        """Test parsing pip download output with 'Downloading' pattern."""
-        output = """Collecting requests==2.28.1
-  Downloading https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz (109kB)
-Successfully downloaded requests"""
-
-        url = self.handler.parse_fallback_output(output)
-        assert (
-            url
-            == "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz"
-        )
-
-    def test_parse_fallback_output_from_pattern(self):
-        """Test parsing pip download output with 'from' pattern."""
-        output = """Collecting requests==2.28.1
-  Using cached requests-2.28.1.tar.gz from https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz
-Successfully downloaded requests"""
-
-        url = self.handler.parse_fallback_output(output)
-        assert (
-            url
-            == "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz"
-        )
-
-    def test_parse_fallback_output_no_url(self):
-        """Test parsing pip download output without URL."""
-        output = """Collecting requests==2.28.1
-  Using cached requests-2.28.1.tar.gz
-Successfully downloaded requests"""
-
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
-
-    def test_parse_fallback_output_multiple_lines(self):
-        """Test parsing pip download output with multiple packages."""
-        output = """Collecting requests==2.28.1
-  Downloading https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz (109kB)
-Collecting urllib3>=1.21.1
-  Downloading https://files.pythonhosted.org/packages/source/u/urllib3/urllib3-1.26.12.tar.gz (300kB)
-Successfully downloaded requests urllib3"""
-
-        url = self.handler.parse_fallback_output(output)
-        # Should return the first URL found
-        assert (
-            url
-            == "https://files.pythonhosted.org/packages/source/r/requests/requests-2.28.1.tar.gz"
-        )
-
-    def test_parse_fallback_output_empty(self):
-        """Test parsing empty pip download output."""
-        output = ""
-        url = self.handler.parse_fallback_output(output)
-        assert url is None
-
-    def test_api_response_edge_cases(self):
+    @pytest.mark.parametrize(
+        "paths,expected",
+        [
+            ({"pip": "/usr/bin/pip"}, True),
+            ({"pip3": "/usr/bin/pip3"}, True),
+            ({}, False),
+        ],
+        ids=["pip", "pip3", "none"],
+    )
+    def test_is_package_manager_available(self, handler, monkeypatch, paths, expected):
+        """Test either pip or pip3 counts as available."""
+        monkeypatch.setattr("purl2src.handlers.base.shutil.which", paths.get)
+        assert handler.is_package_manager_available() is expected
+
+    @pytest.mark.parametrize(
+        "output,expected",
+        [
+            (PIP_DOWNLOADING, REQUESTS_SDIST_URL),
+            (PIP_FROM, REQUESTS_SDIST_URL),
+            (PIP_NO_URL, None),
+            (PIP_MULTI, REQUESTS_SDIST_URL),
+            ("", None),
+        ],
+        ids=["downloading_pattern", "from_pattern", "no_url", "multiple_lines", "empty"],
+    )
+    def test_parse_fallback_output(self, handler, output, expected):
+        """Test parsing pip download output; the first URL found wins."""
+        assert handler.parse_fallback_output(output) == expected
+
+    def test_api_response_edge_cases(self, handler, http_client):
         """Test API response edge cases."""
-        purl = Purl(ecosystem="pypi", name="requests", version="2.28.1")
+        purl = PYPI_PURLS["requests@2.28.1"]
 
         # Empty releases
-        self.http_client.get_json.return_value = {"releases": {}}
-        url = self.handler.get_download_url_from_api(purl)
+        http_client.get_json.return_value = {"releases": {}}
+        url = handler.get_download_url_from_api(purl)
         assert url is None
 
         # No files for version
-        self.http_client.get_json.return_value = {"releases": {"2.28.1": []}}
-        url = self.handler.get_download_url_from_api(purl)
+        http_client.get_json.return_value = {"releases": {"2.28.1": []}}
+        url = handler.get_download_url_from_api(purl)
         assert url is None
 
         # Missing fields
-        self.http_client.get_json.return_value = {"releases": {"2.28.1": [{"url": "test.tar.gz"}]}}
-        url = self.handler.get_download_url_from_api(purl)
+        http_client.get_json.return_value = {"releases": {"2.28.1": [{"url": "test.tar.gz"}]}}
+        url = handler.get_download_url_from_api(purl)
         assert url == "test.tar.gz"
-
-    def test_build_download_url_edge_case_names(self):
-        """Test building download URL with edge case package names."""
-        # Package with underscore
-        purl = Purl(ecosystem="pypi", name="my_package", version="1.0.0")
-        url = self.handler.build_download_url(purl)
-        expected = "https://pypi.python.org/packages/source/m/my_package/my_package-1.0.0.tar.gz"
-        assert url == expected
-
-        # Package with dot
-        purl = Purl(ecosystem="pypi", name="my.package", version="1.0.0")
-        url = self.handler.build_download_url(purl)
-        expected = "https://pypi.python.org/packages/source/m/my.package/my.package-1.0.0.tar.gz"
-        assert url == expected
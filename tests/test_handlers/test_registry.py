@@ -0,0 +1,212 @@
+"""Tests for the handler registry and top-level resolution."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import pytest
+
+from purl2src.handlers import (
+    DEFAULT_CACHE_TTL,
+    PINNED_CACHE_TTL,
+    HANDLERS,
+    _HANDLER_MODULES,
+    _cache_key,
+    _get_handler_class,
+    _get_http_client,
+    _get_url_cache,
+    get_download_url,
+)
+from purl2src.handlers.base import HandlerResult
+from purl2src.handlers.rubygems import RubyGemsHandler
+from purl2src.parser import parse_purl
+from purl2src.utils.cache import URLCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the default cache directory at a temporary location."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr("purl2src.handlers._url_caches", {})
+    return tmp_path / ".cache" / "purl2src"
+
+
+@pytest.fixture
+def no_network():
+    """Fail the test if any HTTP request is attempted."""
+    with patch.multiple(
+        "purl2src.utils.http.HttpClient", get=DEFAULT, head=DEFAULT, get_json=DEFAULT
+    ) as mocks:
+        for mock in mocks.values():
+            mock.side_effect = AssertionError("unexpected network access")
+        yield
+
+
+class TestHandlerRegistry:
+    """Test lazy loading of handler classes."""
+
+    def test_handler_class_is_loaded_on_demand(self):
+        """Test handler modules are imported on first lookup, not on listing."""
+        code = (
+            "import sys; from purl2src.handlers import HANDLERS; "
+            "assert 'gem' in HANDLERS and len(list(HANDLERS)) == len(HANDLERS); "
+            "assert 'purl2src.handlers.rubygems' not in sys.modules; "
+            "assert HANDLERS['gem'].__name__ == 'RubyGemsHandler'; "
+            "assert 'purl2src.handlers.rubygems' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_registry_lists_every_ecosystem(self):
+        """Test the registry lists all supported ecosystems before any are loaded."""
+        assert set(HANDLERS) == set(_HANDLER_MODULES)
+        assert HANDLERS["gem"] is HANDLERS["rubygems"] is RubyGemsHandler
+        assert _get_handler_class("gem") is RubyGemsHandler
+
+    def test_registry_accepts_custom_handlers(self):
+        """Test handlers registered at runtime are listed and resolved."""
+        with patch.dict("purl2src.handlers.HANDLERS", {"custom": RubyGemsHandler}):
+            assert "custom" in HANDLERS
+            assert _get_handler_class("custom") is RubyGemsHandler
+        assert "custom" not in HANDLERS
+        assert set(HANDLERS) == set(_HANDLER_MODULES)
+
+    def test_handler_classes_importable_from_package(self):
+        """Test handler classes can still be imported from purl2src.handlers."""
+        from purl2src.handlers import MavenHandler, NpmHandler, RubyGemsHandler as Gem
+        from purl2src.handlers.maven import MavenHandler as maven_handler
+        from purl2src.handlers.npm import NpmHandler as npm_handler
+
+        assert (MavenHandler, NpmHandler, Gem) == (maven_handler, npm_handler, RubyGemsHandler)
+
+        with pytest.raises(ImportError):
+            from purl2src.handlers import NoSuchHandler  # noqa: F401
+
+    def test_unknown_ecosystem(self):
+        """Test unknown ecosystems have no handler class."""
+        assert _get_handler_class("unknown") is None
+
+    def test_unsupported_ecosystem_result(self, cache_dir):
+        """Test unsupported ecosystems produce a failed result."""
+        result = get_download_url("pkg:unknown/foo@1.0")
+
+        assert result.status == "failed"
+        assert result.method == "unsupported"
+        assert result.error == "Unsupported ecosystem: unknown"
+
+    def test_package_import_does_not_load_handlers(self):
+        """Test importing the package defers loading handler modules."""
+        code = (
+            "import sys, purl2src; "
+            "assert 'purl2src.handlers' not in sys.modules; "
+            "assert callable(purl2src.get_download_url); "
+            "assert 'purl2src.handlers.npm' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestGetDownloadUrl:
+    """Test top-level get_download_url."""
+
+    def test_cache_key_sorts_qualifiers(self):
+        """Test equivalent PURLs map to the same cache key."""
+        first = parse_purl("pkg:maven/org.apache/commons@1.0?type=jar&classifier=sources")
+        second = parse_purl("pkg:maven/org.apache/commons@1.0?classifier=sources&type=jar")
+
+        assert _cache_key(first) == _cache_key(second)
+        assert _cache_key(first) == "pkg:maven/org.apache/commons@1.0?classifier=sources&type=jar"
+
+    def test_cache_hit_skips_resolution(self, cache_dir):
+        """Test a cached result is returned without invoking a handler."""
+        cached = {
+            "purl": "pkg:maven/org.apache/commons@1.0?classifier=sources&type=jar",
+            "download_url": "https://example.com/commons-1.0-sources.jar",
+            "validated": True,
+            "method": "direct",
+            "status": "success",
+            "fallback_available": False,
+        }
+        URLCache(cache_dir=cache_dir).set(cached["purl"], cached)
+
+        with patch("purl2src.handlers.maven.MavenHandler.get_download_url") as mock_resolve:
+            result = get_download_url(
+                "pkg:maven/org.apache/commons@1.0?type=jar&classifier=sources"
+            )
+
+        mock_resolve.assert_not_called()
+        assert result.download_url == "https://example.com/commons-1.0-sources.jar"
+        assert result.validated is True
+
+    def test_validated_result_is_cached(self, cache_dir):
+        """Test validated results are stored under the canonical key."""
+        with patch("purl2src.utils.http.HttpClient.validate_url", return_value=True):
+            result = get_download_url("pkg:cargo/serde@1.0.130")
+
+        assert result.validated is True
+        cache = URLCache(cache_dir=cache_dir, ttl=PINNED_CACHE_TTL)
+        assert cache.get("pkg:cargo/serde@1.0.130")["download_url"] == result.download_url
+
+    def test_unvalidated_result_is_not_cached(self, cache_dir):
+        """Test results that were not validated are not cached."""
+        result = get_download_url("pkg:cargo/serde@1.0.130", validate=False)
+
+        assert result.download_url == "https://crates.io/api/v1/crates/serde/1.0.130/download"
+        assert URLCache(cache_dir=cache_dir).get("pkg:cargo/serde@1.0.130") is None
+
+    def test_http_client_is_shared(self, cache_dir):
+        """Test handlers reuse one HTTP client across calls."""
+        client = _get_http_client()
+        handler_class = MagicMock()
+        handler_class.return_value.get_download_url.return_value = HandlerResult(
+            purl="pkg:cargo/serde@1.0.130", download_url=None, validated=False, method="none"
+        )
+
+        with patch.dict("purl2src.handlers.HANDLERS", {"cargo": handler_class}):
+            get_download_url("pkg:cargo/serde@1.0.130", validate=False)
+            get_download_url("pkg:cargo/tokio@1.0.0", validate=False)
+
+        assert _get_http_client() is client
+        assert [c.args for c in handler_class.call_args_list] == [(client,), (client,)]
+
+    def test_url_cache_is_shared(self, cache_dir):
+        """Test lookups reuse one URL cache per TTL instead of building one per call."""
+        with patch("purl2src.utils.http.HttpClient.validate_url", return_value=True):
+            get_download_url("pkg:cargo/serde@1.0.130")
+            get_download_url("pkg:cargo/tokio@1.0.0")
+
+        pinned = _get_url_cache(PINNED_CACHE_TTL)
+        assert pinned is _get_url_cache(PINNED_CACHE_TTL)
+        assert pinned.ttl == PINNED_CACHE_TTL
+        assert list(pinned._memory_cache) == ["pkg:cargo/serde@1.0.130", "pkg:cargo/tokio@1.0.0"]
+        assert _get_url_cache(DEFAULT_CACHE_TTL) is not pinned
+
+    @pytest.mark.parametrize(
+        "purl,expected",
+        [
+            ("pkg:npm/express@4.18.2", "https://registry.npmjs.org/express/-/express-4.18.2.tgz"),
+            ("pkg:cargo/serde@1.0.152", "https://crates.io/api/v1/crates/serde/1.0.152/download"),
+            ("pkg:gem/rails@7.0.4", "https://rubygems.org/downloads/rails-7.0.4.gem"),
+            (
+                "pkg:nuget/Newtonsoft.Json@13.0.1",
+                "https://api.nuget.org/v3-flatcontainer/newtonsoft.json/13.0.1/"
+                "newtonsoft.json.13.0.1.nupkg",
+            ),
+            (
+                "pkg:maven/org.apache.commons/commons-lang3@3.12.0",
+                "https://repo.maven.apache.org/maven2/org/apache/commons/commons-lang3/3.12.0/"
+                "commons-lang3-3.12.0.jar",
+            ),
+            (
+                "pkg:golang/github.com/gorilla/mux@v1.8.0",
+                "https://proxy.golang.org/github.com%2Fgorilla%2Fmux/@v/v1.8.0.zip",
+            ),
+        ],
+        ids=["npm", "cargo", "gem", "nuget", "maven", "golang"],
+    )
+    def test_no_validate_skips_network(self, cache_dir, no_network, purl, expected):
+        """Test versioned PURLs resolve from URL templates alone when not validating."""
+        result = get_download_url(purl, validate=False)
+
+        assert result.download_url == expected
+        assert result.method == "direct"
+        assert result.validated is False
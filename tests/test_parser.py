@@ -1,5 +1,11 @@
 """Tests for PURL parser."""
 
+import copy
+import json
+import pickle
+import sys
+from dataclasses import FrozenInstanceError, replace
+
 import pytest
 from purl2src.parser import parse_purl, PurlParseError, Purl
 
@@ -80,3 +86,55 @@ class TestPurlParser:
         """Test Purl repr."""
         purl = Purl(ecosystem="npm", name="express", version="4.17.1")
         assert repr(purl) == "Purl(ecosystem='npm', name='express', version='4.17.1')"
+
+    def test_purl_is_immutable(self):
+        """Test Purl objects cannot be modified after creation."""
+        purl = Purl(ecosystem="NPM", name="express", version="4.17.1")
+        assert purl.ecosystem == "npm"
+
+        with pytest.raises(FrozenInstanceError):
+            purl.version = "5.0.0"
+
+    def test_parsed_qualifiers_are_json_serializable(self):
+        """Test parsed qualifiers are a plain dict that json can serialize."""
+        purl = parse_purl("pkg:maven/org.apache/commons@1.0?type=jar")
+
+        assert type(purl.qualifiers) is dict
+        assert json.dumps(purl.qualifiers) == '{"type": "jar"}'
+
+    def test_replace_leaves_memoized_purl_untouched(self):
+        """Test dataclasses.replace derives a modified copy of a memoized PURL."""
+        purl = parse_purl("pkg:maven/org.apache/commons@1.0?type=jar")
+
+        changed = replace(purl, qualifiers={**purl.qualifiers, "classifier": "sources"})
+        assert changed.qualifiers == {"type": "jar", "classifier": "sources"}
+        assert parse_purl("pkg:maven/org.apache/commons@1.0?type=jar").qualifiers == {"type": "jar"}
+
+    def test_qualifiers_are_copied_from_caller(self):
+        """Test a caller's qualifiers dict is copied, not shared with the Purl."""
+        qualifiers = {"type": "jar"}
+        purl = Purl(ecosystem="maven", name="commons", qualifiers=qualifiers)
+        qualifiers["classifier"] = "sources"
+
+        assert purl.qualifiers == {"type": "jar"}
+
+    def test_purl_pickle_and_deepcopy(self):
+        """Test Purl objects survive pickling and deep copies."""
+        purl = parse_purl("pkg:maven/org.apache/commons@1.0?type=jar#src")
+
+        assert pickle.loads(pickle.dumps(purl)) == purl
+        assert copy.deepcopy(purl) == purl
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+    def test_purl_uses_slots(self):
+        """Test Purl instances do not carry a per-instance __dict__."""
+        purl = Purl(ecosystem="npm", name="express", version="4.17.1")
+
+        assert not hasattr(purl, "__dict__")
+        assert replace(purl, version="5.0.0").version == "5.0.0"
+
+    def test_parse_purl_is_memoized(self):
+        """Test parsing the same PURL twice returns the cached object."""
+        first = parse_purl("pkg:npm/express@4.17.1")
+        second = parse_purl("pkg:npm/express@4.17.1")
+        assert first is second
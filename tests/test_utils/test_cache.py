@@ -1,8 +1,11 @@
 """Tests for cache utility."""
 
 import json
+import os
+import stat
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -34,13 +37,66 @@ class TestURLCache:
 
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    def test_cache_initialization_default_dir(self):
+    def test_cache_initialization_default_dir(self, monkeypatch):
         """Test cache initialization with default directory."""
+        monkeypatch.delenv("PURL2SRC_CACHE_SHM", raising=False)
         cache = URLCache()
         expected_dir = Path.home() / ".cache" / "purl2src"
         assert cache.cache_dir == expected_dir
         assert cache.ttl == 3600
 
+    def test_cache_initialization_shm_dir(self, monkeypatch):
+        """Test use_shm places the default directory on tmpfs when it is writable."""
+        monkeypatch.setattr("purl2src.utils.cache._SHM_DIR", self.temp_dir)
+        cache = URLCache(use_shm=True)
+        assert cache.cache_dir == self.temp_dir / f"purl2src-{os.getuid()}"
+        assert cache.cache_dir.exists()
+        assert stat.S_IMODE(cache.cache_dir.stat().st_mode) & 0o077 == 0
+
+    def test_cache_initialization_shm_foreign_owned(self, monkeypatch):
+        """Test use_shm ignores a pre-existing directory owned by another user."""
+        monkeypatch.setattr("purl2src.utils.cache._SHM_DIR", self.temp_dir)
+        other_uid = os.getuid() + 1
+        monkeypatch.setattr("purl2src.utils.cache.os.getuid", lambda: other_uid)
+        (self.temp_dir / f"purl2src-{other_uid}").mkdir(mode=0o700)
+
+        cache = URLCache(use_shm=True)
+        assert cache.cache_dir == Path.home() / ".cache" / "purl2src"
+
+    @pytest.mark.parametrize("kind", ["world_writable", "symlink"])
+    def test_cache_initialization_shm_unsafe_dir(self, monkeypatch, kind):
+        """Test use_shm ignores a pre-existing world-writable or symlinked directory."""
+        monkeypatch.setattr("purl2src.utils.cache._SHM_DIR", self.temp_dir)
+        shm_dir = self.temp_dir / f"purl2src-{os.getuid()}"
+        if kind == "world_writable":
+            shm_dir.mkdir()
+            shm_dir.chmod(0o777)
+        else:
+            target = self.temp_dir / "elsewhere"
+            target.mkdir(mode=0o700)
+            shm_dir.symlink_to(target)
+
+        cache = URLCache(use_shm=True)
+        assert cache.cache_dir == Path.home() / ".cache" / "purl2src"
+
+    @pytest.mark.parametrize(
+        "value, on_shm", [("1", True), ("yes", True), ("0", False), ("", False)]
+    )
+    def test_cache_initialization_shm_from_environment(self, monkeypatch, value, on_shm):
+        """Test PURL2SRC_CACHE_SHM opts into tmpfs when use_shm is not given."""
+        monkeypatch.setattr("purl2src.utils.cache._SHM_DIR", self.temp_dir)
+        monkeypatch.setenv("PURL2SRC_CACHE_SHM", value)
+        cache = URLCache()
+        shm_dir = self.temp_dir / f"purl2src-{os.getuid()}"
+        assert (cache.cache_dir == shm_dir) is on_shm
+        assert URLCache(use_shm=False).cache_dir == Path.home() / ".cache" / "purl2src"
+
+    def test_cache_initialization_shm_unavailable(self, monkeypatch):
+        """Test use_shm falls back to the home cache directory without tmpfs."""
+        monkeypatch.setattr("purl2src.utils.cache._SHM_DIR", self.temp_dir / "missing")
+        cache = URLCache(use_shm=True)
+        assert cache.cache_dir == Path.home() / ".cache" / "purl2src"
+
     def test_cache_initialization_custom_dir(self):
         """Test cache initialization with custom directory."""
         custom_dir = self.temp_dir / "custom"
@@ -54,7 +110,7 @@ class TestURLCache:
         cache_path = self.cache._get_cache_path(self.test_purl)
         assert cache_path.parent == self.temp_dir
         assert cache_path.suffix == ".json"
-        assert len(cache_path.stem) == 16  # SHA256 hash truncated to 16 chars
+        assert len(cache_path.stem) == 16  # 8-byte BLAKE2b digest as hex
 
     def test_cache_path_consistency(self):
         """Test that same PURL generates same cache path."""
@@ -174,6 +230,30 @@ class TestURLCache:
             assert self.cache.get(purl) is None
             assert not self.cache._get_cache_path(purl).exists()
 
+    def test_clear_cache_keeps_other_files(self):
+        """Test clearing the cache leaves unrelated files in the directory alone."""
+        other_file = self.temp_dir / "notes.txt"
+        other_file.write_text("keep me")
+        self.cache.set(self.test_purl, self.test_data)
+
+        self.cache.clear()
+
+        assert other_file.read_text() == "keep me"
+        assert not self.cache._get_cache_path(self.test_purl).exists()
+
+    def test_clear_cache_removes_interrupted_writes(self):
+        """Test clearing removes temporary files left behind by interrupted writes."""
+        cache_path = self.cache._get_cache_path(self.test_purl)
+        stale_tmp = cache_path.with_name(f"{cache_path.name}.1234.5678.tmp")
+        stale_tmp.write_bytes(b"{")
+        other_tmp = self.temp_dir / "download.tmp"
+        other_tmp.write_bytes(b"keep")
+
+        self.cache.clear()
+
+        assert not stale_tmp.exists()
+        assert other_tmp.exists()
+
     def test_invalid_cache_file_handling(self):
         """Test handling of invalid cache files."""
         cache_path = self.cache._get_cache_path(self.test_purl)
@@ -220,6 +300,23 @@ class TestURLCache:
             # Restore permissions for cleanup
             readonly_dir.chmod(0o755)
 
+    def test_set_replaces_file_atomically(self):
+        """Test set writes through a temporary file that is renamed into place."""
+        self.cache.set(self.test_purl, self.test_data)
+
+        assert [p.name for p in self.temp_dir.iterdir()] == [
+            self.cache._get_cache_path(self.test_purl).name
+        ]
+
+    def test_set_removes_temporary_file_on_failure(self):
+        """Test a failed rename leaves neither a cache file nor a temporary file."""
+        with patch("purl2src.utils.cache.os.replace", side_effect=OSError("disk full")):
+            self.cache.set(self.test_purl, self.test_data)
+
+        assert list(self.temp_dir.iterdir()) == []
+        # Memory cache should still work
+        assert self.cache.get(self.test_purl) == self.test_data
+
     def test_cache_with_special_characters_in_purl(self):
         """Test caching PURLs with special characters."""
         special_purls = [
@@ -250,11 +347,11 @@ class TestURLCache:
         cached_data = self.cache.get(self.test_purl)
         assert cached_data == large_data
 
-    @patch("time.time")
+    @patch("time.time_ns")
     def test_cache_timestamp_precision(self, mock_time):
         """Test cache timestamp handling."""
         # Mock time to specific value
-        mock_time.return_value = 1609459200.0  # 2021-01-01 00:00:00
+        mock_time.return_value = 1_609_459_200_000_000_000  # 2021-01-01 00:00:00
 
         self.cache.set(self.test_purl, self.test_data)
 
@@ -263,7 +360,16 @@ class TestURLCache:
         with open(cache_path, "r") as f:
             file_data = json.load(f)
 
-        assert file_data["timestamp"] == 1609459200.0
+        assert file_data["timestamp"] == 1_609_459_200_000_000_000
+
+    def test_legacy_float_timestamp_is_expired(self):
+        """Test entries with a float seconds timestamp from older versions are discarded."""
+        cache_path = self.cache._get_cache_path(self.test_purl)
+        with open(cache_path, "w") as f:
+            json.dump({"timestamp": time.time(), "data": self.test_data}, f)
+
+        assert self.cache.get(self.test_purl) is None
+        assert not cache_path.exists()
 
     def test_memory_cache_update_on_file_read(self):
         """Test that memory cache is updated when reading from file."""
@@ -276,6 +382,38 @@ class TestURLCache:
         assert cached_data == self.test_data
         assert self.test_purl in self.cache._memory_cache
 
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Test the memory cache is bounded and evicts the least recently used entry."""
+        cache = URLCache(cache_dir=self.temp_dir, ttl=3600, max_entries=2)
+        cache.set("pkg:npm/a@1.0.0", {"url": "a"})
+        cache.set("pkg:npm/b@1.0.0", {"url": "b"})
+
+        # Touch "a" so "b" becomes the least recently used entry
+        cache.get("pkg:npm/a@1.0.0")
+        cache.set("pkg:npm/c@1.0.0", {"url": "c"})
+
+        assert list(cache._memory_cache) == ["pkg:npm/a@1.0.0", "pkg:npm/c@1.0.0"]
+        # Evicted entries are still served from the file cache
+        assert cache.get("pkg:npm/b@1.0.0") == {"url": "b"}
+
+    def test_memory_cache_threaded_eviction(self):
+        """Test concurrent gets that evict each other's entries do not raise."""
+        cache = URLCache(cache_dir=self.temp_dir, ttl=3600, max_entries=2)
+        purls = [f"pkg:npm/package{i}@1.0.0" for i in range(6)]
+        for i, purl in enumerate(purls):
+            cache.set(purl, {"index": i})
+
+        def read_all():
+            for _ in range(50):
+                for i, purl in enumerate(purls):
+                    assert cache.get(purl) == {"index": i}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(read_all) for _ in range(4)]:
+                future.result()
+
+        assert len(cache._memory_cache) <= 2
+
     def test_concurrent_cache_operations(self):
         """Test cache behavior with concurrent-like operations."""
         # Simulate multiple rapid operations
@@ -2,14 +2,15 @@
 
 import hashlib
 import json
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from purl2src.utils.http import HttpClient
+from purl2src import __version__
+from purl2src.utils.http import DOWNLOAD_CHUNK_SIZE, POOL_CONNECTIONS, POOL_MAXSIZE, HttpClient
 
 
 class TestHttpClient:
@@ -125,6 +126,23 @@ class TestHttpClient:
 
         assert result is False
 
+    @pytest.mark.parametrize("head_status", [405, 501])
+    @patch("requests.Session.get")
+    @patch("requests.Session.head")
+    def test_validate_url_falls_back_to_streamed_get(self, mock_head, mock_get, head_status):
+        """Test URL validation retries with a streamed GET when HEAD is unsupported."""
+        mock_head.return_value = Mock(status_code=head_status)
+        mock_get.return_value = MagicMock(status_code=200)
+        mock_get.return_value.__enter__.return_value = mock_get.return_value
+
+        url = "https://example.com/no-head"
+        result = self.client.validate_url(url)
+
+        assert result is True
+        mock_get.assert_called_once_with(url, allow_redirects=True, stream=True, timeout=30)
+        mock_get.return_value.__exit__.assert_called_once()
+        mock_get.return_value.iter_content.assert_not_called()
+
     @patch("requests.Session.get")
     def test_download_and_verify_success(self, mock_get):
         """Test successful download and verification."""
@@ -149,7 +167,7 @@ class TestHttpClient:
     def test_download_and_verify_checksum_mismatch(self, mock_get):
         """Test download with checksum mismatch."""
         content = b"test file content"
-        wrong_hash = "wrong_checksum"
+        wrong_hash = hashlib.sha256(b"other content").hexdigest()
 
         mock_response = Mock()
         mock_response.iter_content.return_value = [content]
@@ -158,9 +176,17 @@ class TestHttpClient:
 
         url = "https://example.com/file.txt"
 
-        with pytest.raises(ValueError, match="Checksum mismatch"):
+        with pytest.raises(ValueError, match=f"^Checksum mismatch: expected {wrong_hash}, got "):
             self.client.download_and_verify(url, wrong_hash)
 
+    @patch("requests.Session.get")
+    def test_download_and_verify_malformed_checksum_skips_download(self, mock_get):
+        """Test a checksum that is not hex fails before anything is downloaded."""
+        with pytest.raises(ValueError, match="^Invalid expected checksum 'wrong_checksum'"):
+            self.client.download_and_verify("https://example.com/file.txt", "wrong_checksum")
+
+        mock_get.assert_not_called()
+
     @patch("requests.Session.get")
     def test_download_and_verify_no_checksum(self, mock_get):
         """Test download without checksum verification."""
@@ -192,6 +218,7 @@ class TestHttpClient:
         result = self.client.download_and_verify(url, expected_hash)
 
         assert result == full_content
+        mock_response.iter_content.assert_called_once_with(chunk_size=DOWNLOAD_CHUNK_SIZE)
 
     @patch("requests.Session.get")
     def test_download_and_verify_different_algorithm(self, mock_get):
@@ -209,6 +236,23 @@ class TestHttpClient:
 
         assert result == content
 
+    @patch("requests.Session.get")
+    def test_download_and_verify_xxhash_algorithm(self, mock_get):
+        """Test download verified with a non-cryptographic xxhash digest."""
+        xxhash = pytest.importorskip("xxhash")
+        content = b"test file content"
+        expected_hash = xxhash.xxh3_128(content).hexdigest()
+
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [content]
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        url = "https://example.com/file.txt"
+        result = self.client.download_and_verify(url, expected_hash, algorithm="xxh3_128")
+
+        assert result == content
+
     @patch("requests.Session.get")
     def test_download_and_verify_request_exception(self, mock_get):
         """Test download with request exception."""
@@ -237,7 +281,7 @@ class TestHttpClient:
         json_data = {"key": "value", "number": 42}
 
         mock_response = Mock()
-        mock_response.json.return_value = json_data
+        mock_response.content = json.dumps(json_data).encode()
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -254,7 +298,7 @@ class TestHttpClient:
         json_data = {"data": "test"}
 
         mock_response = Mock()
-        mock_response.json.return_value = json_data
+        mock_response.content = json.dumps(json_data).encode()
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -265,6 +309,87 @@ class TestHttpClient:
         assert result == json_data
         mock_get.assert_called_once_with(url, headers=headers, timeout=30)
 
+    @patch("requests.Session.get")
+    def test_get_json_etag_revalidation(self, mock_get):
+        """Test a cached body is revalidated with If-None-Match and reused on 304."""
+        json_data = {"data": "test"}
+        first = Mock(status_code=200, headers={"ETag": '"v1"'})
+        first.content = json.dumps(json_data).encode()
+        not_modified = Mock(status_code=304, headers={"ETag": '"v1"'})
+        mock_get.side_effect = [first, not_modified]
+
+        client = HttpClient(etag_cache_size=8)
+        url = "https://api.example.com/data"
+        headers = {"Accept": "application/json"}
+
+        result = client.get_json(url, headers=headers)
+        assert result == json_data
+        # The 304 response reuses the stored body, parsed into a fresh object
+        revalidated = client.get_json(url, headers=headers)
+        assert revalidated == json_data
+        assert revalidated is not result
+
+        assert mock_get.call_args_list[1] == call(
+            url, headers={"Accept": "application/json", "If-None-Match": '"v1"'}, timeout=30
+        )
+        # The caller's headers are not modified
+        assert headers == {"Accept": "application/json"}
+        client.close()
+
+    @patch("requests.Session.get")
+    def test_get_json_etag_result_mutation_does_not_leak(self, mock_get):
+        """Test mutating a returned result does not change later cache hits."""
+        first = Mock(status_code=200, headers={"ETag": '"v1"'})
+        first.content = b'{"versions": {"1.0": {"dist": "a.tgz"}}}'
+        not_modified = Mock(status_code=304, headers={"ETag": '"v1"'})
+        mock_get.side_effect = [first, not_modified]
+
+        client = HttpClient(etag_cache_size=8)
+        url = "https://api.example.com/data"
+        client.get_json(url)["versions"]["1.0"]["dist"] = "tampered"
+
+        assert client.get_json(url) == {"versions": {"1.0": {"dist": "a.tgz"}}}
+        client.close()
+
+    @patch("requests.Session.get")
+    def test_get_json_etag_304_without_cached_body(self, mock_get):
+        """Test a 304 with nothing cached is retried without If-None-Match."""
+        not_modified = Mock(status_code=304, headers={"ETag": '"v1"'})
+        fresh = Mock(status_code=200, headers={"ETag": '"v1"'})
+        fresh.content = b'{"data": "test"}'
+        mock_get.side_effect = [not_modified, fresh]
+
+        client = HttpClient(etag_cache_size=8)
+        url = "https://api.example.com/data"
+        result = client.get_json(url, headers={"If-None-Match": '"v1"'})
+
+        assert result == {"data": "test"}
+        assert mock_get.call_args_list == [
+            call(url, headers={"If-None-Match": '"v1"'}, timeout=30),
+            call(url, headers={}, timeout=30),
+        ]
+        client.close()
+
+    @patch("requests.Session.get")
+    def test_get_json_etag_cache_evicts_oldest(self, mock_get):
+        """Test the ETag cache keeps at most etag_cache_size responses."""
+        responses = []
+        for i in range(3):
+            response = Mock(status_code=200, headers={"ETag": f'"{i}"'})
+            response.content = json.dumps({"i": i}).encode()
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        client = HttpClient(etag_cache_size=2)
+        for i in range(3):
+            client.get_json(f"https://api.example.com/{i}")
+
+        assert list(client._etag_cache) == [
+            ("https://api.example.com/1", None),
+            ("https://api.example.com/2", None),
+        ]
+        client.close()
+
     @patch("requests.Session.get")
     def test_get_json_request_exception(self, mock_get):
         """Test JSON request with request exception."""
@@ -291,7 +416,7 @@ class TestHttpClient:
     def test_get_json_decode_error(self, mock_get):
         """Test JSON request with JSON decode error."""
         mock_response = Mock()
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "doc", 0)
+        mock_response.content = b"invalid json"
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -370,7 +495,7 @@ class TestHttpClient:
     def test_user_agent_header(self):
         """Test that User-Agent header is set correctly."""
         user_agent = self.client.session.headers.get("User-Agent")
-        assert "purl2src" in user_agent
+        assert user_agent == f"purl2src/{__version__}"
 
     @patch("requests.Session.get")
     def test_download_empty_content(self, mock_get):
@@ -438,6 +563,6 @@ class TestHttpClient:
     def test_session_adapter_pool_configuration(self):
         """Test session adapter pool configuration."""
         adapter = self.client.session.get_adapter("https://example.com")
-        # HTTPAdapter pool_maxsize is set in __init__ but might not be directly accessible
-        # We just verify it's an HTTPAdapter which should have pool configuration
         assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == POOL_CONNECTIONS
+        assert adapter._pool_maxsize == POOL_MAXSIZE